@@ -0,0 +1,32 @@
+"""
+Analyzer Registry
+Save as: src/analyzers_registry.py
+
+Process-wide shared instances of the Ollama-backed analyzers, keyed by class
+and model, so test scripts and parameter sweeps build each one (and check its
+connection) only once.
+"""
+
+from functools import lru_cache
+
+from config import MODEL_NAME
+
+DEFAULT_MODEL = MODEL_NAME
+
+_connected = set()
+
+
+@lru_cache(maxsize=8)
+def get(cls, model_name: str = DEFAULT_MODEL):
+    """Shared instance of an analyzer class for one model"""
+    return cls(model_name)
+
+
+def check_connection(analyzer) -> bool:
+    """analyzer.test_connection(), skipped once it has succeeded for this instance"""
+    if id(analyzer) in _connected:
+        return True
+    if analyzer.test_connection():
+        _connected.add(id(analyzer))
+        return True
+    return False
@@ -8,6 +8,7 @@ import tempfile
 from pathlib import Path
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
+import asyncio
 import json
 import time
 
@@ -24,6 +25,9 @@ try:
 except ImportError:
     HAS_EDGE_TTS = False
 
+# Concurrent Edge-TTS requests per batch (stays under the service's per-IP limit)
+EDGE_TTS_CONCURRENCY = 8
+
 
 @dataclass
 class AudioSegment:
@@ -154,7 +158,6 @@ Dr. Ava D. and Prof. Marcus Webb are about to find out!"""
             communicate = edge_tts.Communicate(text, voice_id)
             await communicate.save(output_file)
         
-        import asyncio
         asyncio.run(generate_audio())
         
         # Get duration (rough estimate: ~150 words per minute)
@@ -199,8 +202,8 @@ Dr. Ava D. and Prof. Marcus Webb are about to find out!"""
         
         return duration
     
-    def generate_audio_segment(self, text: str, speaker: str, segment_type: str = "conversation") -> AudioSegment:
-        """Generate audio for one text segment"""
+    def _segment_target(self, speaker: str, segment_type: str, index: int = None) -> Tuple[VoiceProfile, Path]:
+        """Voice profile and output path for one segment"""
         
         # Determine voice profile
         if "ava" in speaker.lower():
@@ -208,10 +211,18 @@ Dr. Ava D. and Prof. Marcus Webb are about to find out!"""
         else:
             profile = self.voice_profiles["prof_marcus"]
         
-        # Create output filename
+        # Create output filename (batched segments share a timestamp, so add the index)
         timestamp = int(time.time() * 1000)
         safe_speaker = speaker.replace(" ", "_").replace(".", "")
-        output_file = self.output_dir / f"{safe_speaker}_{segment_type}_{timestamp}.wav"
+        suffix = f"{timestamp}" if index is None else f"{timestamp}_{index:03d}"
+        output_file = self.output_dir / f"{safe_speaker}_{segment_type}_{suffix}.wav"
+        
+        return profile, output_file
+    
+    def generate_audio_segment(self, text: str, speaker: str, segment_type: str = "conversation") -> AudioSegment:
+        """Generate audio for one text segment"""
+        
+        profile, output_file = self._segment_target(speaker, segment_type)
         
         # Generate audio based on selected engine
         try:
@@ -238,27 +249,69 @@ Dr. Ava D. and Prof. Marcus Webb are about to find out!"""
             print(f"   ❌ Error generating audio for {speaker}: {e}")
             raise
     
+    def generate_audio_batch(self, turns: List[Tuple[str, str, str]]) -> List[AudioSegment]:
+        """Generate audio for many (text, speaker, segment_type) turns, in order
+        
+        Edge-TTS is a network call, so its turns are synthesized concurrently;
+        the local engines fall back to one segment at a time.
+        """
+        
+        if self.selected_engine != "edge-tts":
+            return [self.generate_audio_segment(text, speaker, segment_type)
+                    for text, speaker, segment_type in turns]
+        
+        targets = [self._segment_target(speaker, segment_type, index)
+                   for index, (_, speaker, segment_type) in enumerate(turns)]
+        
+        async def generate_all():
+            semaphore = asyncio.Semaphore(EDGE_TTS_CONCURRENCY)
+            
+            async def generate_one(text, voice_id, output_file):
+                async with semaphore:
+                    await edge_tts.Communicate(text, voice_id).save(output_file)
+            
+            await asyncio.gather(*(
+                generate_one(text, profile.voice_id, str(output_file))
+                for (text, _, _), (profile, output_file) in zip(turns, targets)
+            ))
+        
+        try:
+            asyncio.run(generate_all())
+        except Exception as e:
+            print(f"   ❌ Error generating batched audio: {e}")
+            raise
+        
+        segments = []
+        for (text, speaker, segment_type), (_, output_file) in zip(turns, targets):
+            # Estimate duration (~150 words per minute), same as text_to_speech_edge
+            duration = (len(text.split()) / 150) * 60
+            print(f"   🎵 Generated: {speaker} ({duration:.1f}s)")
+            segments.append(AudioSegment(
+                speaker=speaker,
+                text=text,
+                audio_file=str(output_file),
+                duration=duration,
+                segment_type=segment_type
+            ))
+        
+        return segments
+    
     def create_conversation_audio(self, conversation_script) -> List[AudioSegment]:
         """Convert complete conversation script to audio segments"""
         
         print("🎙️ Generating conversation audio...")
         
-        audio_segments = []
+        turns = []
         
-        # 1. Generate YouTube intro
+        # 1. YouTube intro
         paper_title = conversation_script.paper_topic
         intro_text = self.generate_youtube_intro(paper_title)
         
-        print("   📺 Generating YouTube intro...")
-        intro_segment = self.generate_audio_segment(
-            intro_text, 
-            "Narrator",  # Could use either voice for intro
-            "intro"
-        )
-        audio_segments.append(intro_segment)
+        print("   📺 Queueing YouTube intro...")
+        turns.append((intro_text, "Narrator", "intro"))  # Could use either voice for intro
         
-        # 2. Generate conversation turns
-        print(f"   💬 Generating {len(conversation_script.turns)} conversation turns...")
+        # 2. Conversation turns
+        print(f"   💬 Queueing {len(conversation_script.turns)} conversation turns...")
         
         for turn in conversation_script.turns:
             # Update speaker name from Sarah Chen to Ava D.
@@ -266,24 +319,15 @@ Dr. Ava D. and Prof. Marcus Webb are about to find out!"""
             if "Sarah" in speaker_name:
                 speaker_name = "Dr. Ava D."
             
-            segment = self.generate_audio_segment(
-                turn.content,
-                speaker_name,
-                "conversation"
-            )
-            audio_segments.append(segment)
+            turns.append((turn.content, speaker_name, "conversation"))
         
-        # 3. Generate conclusion
+        # 3. Conclusion
         if conversation_script.conclusion:
-            print("   🏁 Generating conclusion...")
-            conclusion_segment = self.generate_audio_segment(
-                conversation_script.conclusion,
-                "Narrator",
-                "conclusion"
-            )
-            audio_segments.append(conclusion_segment)
+            print("   🏁 Queueing conclusion...")
+            turns.append((conversation_script.conclusion, "Narrator", "conclusion"))
         
-        return audio_segments
+        # Synthesize everything in one batch, keeping script order
+        return self.generate_audio_batch(turns)
     
     def combine_audio_segments(self, segments: List[AudioSegment], output_file: str) -> Dict:
         """Combine all audio segments into final podcast"""
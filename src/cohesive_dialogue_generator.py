@@ -16,6 +16,7 @@ import re
 from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass
 from src.personalities_updated import UpdatedResearchPersonalities
+from src.config import MODEL_NAME, OLLAMA_BASE_URL
 
 
 @dataclass
@@ -43,7 +44,7 @@ class CohesiveConversationScript:
 class CohesiveDialogueGenerator:
     """Generates cohesive, professional dialogue in debate format"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from urllib.parse import urlsplit
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -12,9 +13,36 @@ OUTPUT_DIR = PROJECT_ROOT / "data" / "output"
 TEST_PAPERS_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-# Ollama settings
-OLLAMA_BASE_URL = "http://localhost:11434"
-MODEL_NAME = "llama3.1:8b"
+# Ollama settings (environment overrides are read here only)
+OLLAMA_DEFAULT_PORT = 11434
+
+
+def _ollama_base_url(host: str) -> str:
+    """Client URL for an OLLAMA_HOST value, read the way the ollama CLI reads it
+    
+    A bare host gets http and port 11434 (a URL with an explicit scheme keeps
+    that scheme's own default port), and a server bound to all interfaces
+    (0.0.0.0) is reached on localhost.
+    """
+    scheme, sep, address = host.strip().rstrip("/").rpartition("://")
+    if not sep:
+        scheme = "http"
+    hostport, slash, path = address.partition("/")
+    if hostport.count(":") > 1 and not hostport.startswith("["):
+        hostport = f"[{hostport}]"  # Bare IPv6 literal
+    parts = urlsplit(f"{scheme}://{hostport}")
+    hostname = parts.hostname or "localhost"
+    if hostname == "0.0.0.0":
+        hostname = "localhost"
+    elif ":" in hostname:
+        hostname = f"[{hostname}]"
+    port = parts.port or ("" if sep else OLLAMA_DEFAULT_PORT)
+    return f"{scheme}://{hostname}{f':{port}' if port else ''}{slash}{path}"
+
+
+OLLAMA_BASE_URL = _ollama_base_url(os.environ.get("OLLAMA_HOST", "http://localhost:11434"))
+# Default model for every analyzer/generator; e.g. OLLAMA_MODEL=llama3.2:3b for faster test runs
+MODEL_NAME = os.environ.get("OLLAMA_MODEL", "llama3.1:8b")
 
 # Processing settings
 MAX_CHUNK_SIZE = 4000  # Characters per chunk
@@ -5,6 +5,7 @@ import requests
 import json
 from typing import Dict, List, Tuple, Any
 from personalities import ResearchPersonalities, PersonalityProfile
+from config import MODEL_NAME, OLLAMA_BASE_URL
 from dataclasses import dataclass
 
 
@@ -33,7 +34,7 @@ class ConversationScript:
 class FixedDialogueEngine:
     """FIXED dialogue generator that uses Phase 1 results"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
@@ -1,11 +1,85 @@
 """Enhanced Two-Stage Paper Analyzer - Stage 1: Core Understanding"""
 
-import requests
+import hashlib
 import json
 import re
-from typing import Dict, List, Tuple, Optional
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 
+from config import MODEL_NAME
+from ollama_http import OLLAMA_BASE_URL, post_generate
+from pipeline_cache import Uncached, disk_cache
+
+# Bump when the section patterns change, so cached detections are recomputed
+SECTION_DETECTION_VERSION = "1"
+
+# Papers whose detected sections stay in memory per analyzer
+SECTION_MEMO_SIZE = 8
+
+# Cue words that every abstract/conclusion/future-work pattern needs; one sweep
+# finds which are present, so patterns for absent sections never scan the text
+SECTION_CUE_RE = re.compile(r'abstract|conclusion|concluding remark|future (?:work|research|direction)')
+SECTION_CUES = {
+    'abstract': ('abstract',),
+    'conclusion': ('conclusion', 'concluding remark'),
+    'future_work': ('future work', 'future research', 'future direction'),
+}
+
+# Closing remarks the model tends to add after the last Stage 1 section (debate
+# seed points); the parser ignores everything past them, so generation stops there
+STAGE1_CLOSING_RE = re.compile(
+    r'(?:overall|in (?:summary|conclusion)|to summarize|these (?:debate )?points)\b', re.IGNORECASE
+)
+# Prose lines a closing run must reach, with no bullet or header among them,
+# before the stream is cut
+STAGE1_CLOSING_LINES = 3
+
+
+def _split_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Whole lines from streamed text fragments (the last one may lack a newline)"""
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        *complete, pending = pending.split('\n')
+        yield from complete
+    yield pending
+
+
+def _continues_stage1(stripped: str) -> bool:
+    """Whether a line carries on the structured response (a bullet or a header)"""
+    return stripped.startswith(('-', '•', '*', '#')) or stripped[:1].isdigit() or stripped.endswith(':')
+
+
+def stage1_lines_before_closing(lines: Iterable[str]) -> Iterator[str]:
+    """Stage 1 response lines up to the closing remarks after the debate points
+    
+    Only a closing line after a kept debate bullet can start the closing run,
+    so an intro line such as "Overall, experts could debate..." never ends it.
+    The run is held back: a later bullet or header means it was elaboration
+    between points and it is kept; otherwise it is dropped.
+    """
+    in_debate = False
+    debate_points = 0
+    held = []
+    for line in lines:
+        stripped = line.strip()
+        if held and not _continues_stage1(stripped):
+            held.append(line)
+            if sum(1 for held_line in held if held_line.strip()) >= STAGE1_CLOSING_LINES:
+                return
+            continue
+        yield from held
+        held = []
+        if debate_points and STAGE1_CLOSING_RE.match(stripped):
+            held.append(line)
+            continue
+        # Same bullet rule as _parse_stage1_response uses for debate points
+        if in_debate and stripped.startswith(('-', '•', '*')) and len(stripped) > 15:
+            debate_points += 1
+        in_debate = in_debate or 'SEED POINTS' in line.upper()
+        yield line
+
 
 @dataclass
 class CoreUnderstanding:
@@ -20,33 +94,78 @@ class CoreUnderstanding:
 class EnhancedPaperAnalyzer:
     """Two-stage paper analyzer with academic-grade depth"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
+        self._section_memo = OrderedDict()  # text digest -> sections, LRU order
     
-    def _call_ollama(self, prompt: str, max_length: int = 2000) -> str:
-        """Enhanced Ollama API call with longer responses for deep analysis"""
-        payload = {
+    def _ollama_payload(self, prompt: str, max_length: int, stream: bool = False) -> Dict:
+        """Request body for /api/generate"""
+        return {
             "model": self.model_name,
             "prompt": prompt,
-            "stream": False,
+            "stream": stream,
             "options": {
                 "temperature": 0.6,  # Lower temperature for more focused analysis
                 "top_p": 0.9,
                 "num_predict": max_length
             }
         }
+    
+    def _call_ollama(self, prompt: str, max_length: int = 2000) -> str:
+        """Enhanced Ollama API call with longer responses for deep analysis"""
+        payload = self._ollama_payload(prompt, max_length)
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=300)  # Longer timeout
+            response = post_generate(self.api_url, payload, timeout=300)  # Longer timeout
             response.raise_for_status()
             result = response.json()
             return result.get("response", "").strip()
         except Exception as e:
             return f"[Analysis Error: {str(e)}]"
     
+    def _stream_tokens(self, prompt: str, max_length: int) -> Iterator[str]:
+        """Response fragments as Ollama generates them (hook for echoing/debugging)"""
+        payload = self._ollama_payload(prompt, max_length, stream=True)
+        with post_generate(self.api_url, payload, timeout=300, stream=True) as response:
+            response.raise_for_status()
+            for frame_line in response.iter_lines():
+                if not frame_line:
+                    continue
+                frame = json.loads(frame_line)
+                yield frame.get("response", "")
+                if frame.get("done"):
+                    break
+    
+    def _stream_stage1(self, prompt: str, max_length: int = 2000) -> str:
+        """Stream a Stage 1 generation and hang up once the closing remarks are clear"""
+        tokens = self._stream_tokens(prompt, max_length)
+        try:
+            return "\n".join(stage1_lines_before_closing(_split_lines(tokens))).strip()
+        except Exception as e:
+            return f"[Analysis Error: {str(e)}]"
+        finally:
+            tokens.close()  # Closes the response, so generation stops server-side
+    
     def enhanced_section_detection(self, text: str) -> Dict[str, str]:
+        """ROBUST section detection, memoized in memory on a digest of the text"""
+        
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        sections = self._section_memo.get(digest)
+        if sections is None:
+            sections = self._detect_sections(text)
+            self._section_memo[digest] = sections
+            if len(self._section_memo) > SECTION_MEMO_SIZE:
+                self._section_memo.popitem(last=False)
+        else:
+            self._section_memo.move_to_end(digest)
+        
+        # Callers may add fallback sections, so never hand out the memoized dict
+        return dict(sections)
+    
+    @disk_cache(version=SECTION_DETECTION_VERSION)
+    def _detect_sections(self, text: str) -> Dict[str, str]:
         """ROBUST section detection that handles poorly formatted PDFs"""
         
         sections = {}
@@ -87,8 +206,12 @@ class EnhancedPaperAnalyzer:
             ]
         }
         
+        cues_present = {match.group() for match in SECTION_CUE_RE.finditer(text_lower)}
+        
         # Try robust extraction
         for section_name, patterns in robust_patterns.items():
+            if section_name in SECTION_CUES and cues_present.isdisjoint(SECTION_CUES[section_name]):
+                continue
             section_text = self._robust_extract_section(text, text_lower, patterns)
             if section_text:
                 cleaned = self._clean_section_text(section_text)
@@ -98,14 +221,16 @@ class EnhancedPaperAnalyzer:
                     print(f"   Preview: {cleaned[:100]}...")
         
         # FALLBACK: Manual keyword search for critical sections
-        if 'abstract' not in sections:
-            abstract_text = self._manual_keyword_extract(text, 'abstract', next_keywords=['introduction', 'keywords', '1.'])
+        if 'abstract' not in sections and 'abstract' in cues_present:
+            abstract_text = self._manual_keyword_extract(text, 'abstract', next_keywords=['introduction', 'keywords', '1.'],
+                                                         text_lower=text_lower)
             if abstract_text:
                 sections['abstract'] = abstract_text
                 print(f"✅ MANUAL: Found abstract: {len(abstract_text)} characters")
         
-        if 'conclusion' not in sections:
-            conclusion_text = self._manual_keyword_extract(text, 'conclusion', next_keywords=['references', 'acknowledgments', 'appendix'])
+        if 'conclusion' not in sections and 'conclusion' in cues_present:
+            conclusion_text = self._manual_keyword_extract(text, 'conclusion', next_keywords=['references', 'acknowledgments', 'appendix'],
+                                                           text_lower=text_lower)
             if conclusion_text:
                 sections['conclusion'] = conclusion_text
                 print(f"✅ MANUAL: Found conclusion: {len(conclusion_text)} characters")
@@ -143,9 +268,9 @@ class EnhancedPaperAnalyzer:
         """Robust extraction that handles continuous text"""
         for pattern in patterns:
             try:
-                matches = list(re.finditer(pattern, text_lower, re.DOTALL | re.IGNORECASE))
-                if matches:
-                    match = matches[0]
+                # Only the first match is used, so stop scanning once it is found
+                match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
+                if match:
                     if len(match.groups()) > 0:
                         # Extract from original text to preserve case
                         start = match.start(1)
@@ -158,9 +283,11 @@ class EnhancedPaperAnalyzer:
                 continue
         return None
     
-    def _manual_keyword_extract(self, text: str, keyword: str, next_keywords: List[str], max_length: int = 2000) -> Optional[str]:
+    def _manual_keyword_extract(self, text: str, keyword: str, next_keywords: List[str], max_length: int = 2000,
+                                text_lower: Optional[str] = None) -> Optional[str]:
         """Manual extraction by finding keyword and extracting until next major section"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Find the keyword
         keyword_pos = text_lower.find(keyword.lower())
@@ -174,10 +301,11 @@ class EnhancedPaperAnalyzer:
         while start < len(text) and text[start] in ' :\n\t':
             start += 1
         
-        # Find the end by looking for next major section
+        # Find the end by looking for next major section; matches past
+        # start + max_length are cut off below, so only search that window
         end = len(text)
         for next_keyword in next_keywords:
-            next_pos = text_lower.find(next_keyword.lower(), start)
+            next_pos = text_lower.find(next_keyword.lower(), start, start + max_length + len(next_keyword))
             if next_pos != -1:
                 end = min(end, next_pos)
         
@@ -194,10 +322,9 @@ class EnhancedPaperAnalyzer:
     def _extract_section_with_patterns(self, text: str, text_lower: str, patterns: List[str]) -> Optional[str]:
         """Extract section using multiple patterns"""
         for pattern in patterns:
-            matches = list(re.finditer(pattern, text_lower, re.DOTALL | re.MULTILINE | re.IGNORECASE))
-            if matches:
-                match = matches[0]
-                if len(matches[0].groups()) > 0:
+            match = re.search(pattern, text_lower, re.DOTALL | re.MULTILINE | re.IGNORECASE)
+            if match:
+                if len(match.groups()) > 0:
                     # Extract from original text to preserve case
                     start = match.start(1)
                     end = match.end(1)
@@ -228,8 +355,14 @@ class EnhancedPaperAnalyzer:
         text = re.sub(r'\b[A-Z][a-z]+ [A-Z][a-z]+\d+\b', '', text)
         return text.strip()
     
+    # Version 2 drops entries stored from failed calls before Uncached existed
+    @disk_cache(version="3")
     def stage1_core_understanding_analysis(self, core_sections: Dict[str, str]) -> CoreUnderstanding:
-        """Stage 1: Deep analysis of core sections only"""
+        """Stage 1: Deep analysis of core sections only
+        
+        Failed Ollama calls and responses nothing could be parsed from are
+        returned as usual but never written to the disk cache.
+        """
         
         print("🔍 Stage 1: Analyzing core sections for deep understanding...")
         
@@ -282,12 +415,17 @@ REQUIRED ANALYSIS STRUCTURE:
 Be specific, quote exact phrases, and provide evidence-based analysis. Focus on generating sophisticated debate points that academic experts would actually argue about."""
 
         # Get the analysis
-        analysis_response = self._call_ollama(stage1_prompt, max_length=2500)
+        analysis_response = self._stream_stage1(stage1_prompt, max_length=2500)
         
         # Parse the structured response
         parsed_analysis = self._parse_stage1_response(analysis_response)
         
         print(f"✅ Stage 1 Complete: {parsed_analysis.field_classification}")
+        
+        parsed_anything = (parsed_analysis.research_story_arc or parsed_analysis.confidence_assessment
+                           or parsed_analysis.debate_seed_points or parsed_analysis.key_technical_elements)
+        if analysis_response.startswith("[Analysis Error") or not parsed_anything:
+            return Uncached(parsed_analysis)
         return parsed_analysis
     
     def _parse_stage1_response(self, response: str) -> CoreUnderstanding:
@@ -340,22 +478,23 @@ Be specific, quote exact phrases, and provide evidence-based analysis. Focus on
             
             # Parse content - more flexible patterns
             if current_section == 'story':
-                if ':' in line and any(word in line.lower() for word in ['problem', 'solution', 'finding', 'significance']):
-                    key, value = line.split(':', 1)
+                key, sep, value = line.partition(':')
+                if sep and any(word in line.lower() for word in ['problem', 'solution', 'finding', 'significance']):
                     key_clean = key.strip('- *').lower().replace(' ', '_')
                     research_story[key_clean] = value.strip()
                     print(f"  📝 Story: {key_clean} = {value[:50]}")
             
             elif current_section == 'confidence':
-                if ':' in line and any(word in line.lower() for word in ['confidence', 'limitation', 'language', 'claim']):
-                    key, value = line.split(':', 1)
+                key, sep, value = line.partition(':')
+                if sep and any(word in line.lower() for word in ['confidence', 'limitation', 'language', 'claim']):
                     key_clean = key.strip('- *').lower().replace(' ', '_')
                     confidence_assessment[key_clean] = value.strip()
                     print(f"  🔍 Confidence: {key_clean} = {value[:50]}")
             
             elif current_section == 'field':
-                if 'domain' in line.lower() and ':' in line:
-                    field_classification = line.split(':', 1)[1].strip()
+                _, sep, value = line.partition(':')
+                if sep and 'domain' in line.lower():
+                    field_classification = value.strip()
                     print(f"  🎯 Field: {field_classification}")
                 elif line.startswith(('-', '•', '*')) and len(line) > 15:
                     element = line.strip('- •*').strip()
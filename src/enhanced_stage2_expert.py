@@ -6,14 +6,16 @@ Uses expert-persona prompts for maximum depth analysis that generates
 the sophisticated technical debates real academics would have.
 """
 
-import requests
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
 from expert_deep_prompts import ExpertDeepPrompts
 from enhanced_analyzer import CoreUnderstanding
+from config import MODEL_NAME
+from ollama_http import OLLAMA_BASE_URL, OLLAMA_SLOTS, call_many, post_generate
 
 
 @dataclass 
@@ -63,7 +65,7 @@ class ComprehensiveExpertAnalysis:
 class EnhancedStage2Expert:
     """Enhanced Stage 2 using expert-level deep analysis prompts"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
@@ -83,7 +85,8 @@ class EnhancedStage2Expert:
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=500)  # Longer for complex analysis
+            with OLLAMA_SLOTS:
+                response = post_generate(self.api_url, payload, timeout=500)  # Longer for complex analysis
             response.raise_for_status()
             result = response.json()
             return result.get("response", "").strip()
@@ -100,7 +103,8 @@ class EnhancedStage2Expert:
         main_claims = self._extract_key_claims(core_understanding)
         field = core_understanding.field_classification
         
-        expert_evidence_list = []
+        analyzed_claims = []
+        prompts = []
         
         for claim in main_claims[:3]:  # Focus on top 3 claims for depth
             print(f"   🎯 Analyzing claim: {claim[:60]}...")
@@ -112,18 +116,21 @@ class EnhancedStage2Expert:
                 continue
             
             # Generate multi-expert analysis prompt
-            multi_expert_prompt = self.expert_prompts.generate_multi_expert_analysis_prompt(
+            analyzed_claims.append(claim)
+            prompts.append(self.expert_prompts.generate_multi_expert_analysis_prompt(
                 claim, evidence_text, field
-            )
-            
-            # Get comprehensive expert analysis
-            expert_response = self._call_ollama(multi_expert_prompt, max_length=5000)
-            
+            ))
+        
+        # Get comprehensive expert analysis for all claims at once
+        expert_responses = call_many(lambda prompt: self._call_ollama(prompt, max_length=5000), prompts)
+        
+        expert_evidence_list = []
+        for claim, expert_response in zip(analyzed_claims, expert_responses):
             # Parse expert perspectives
             expert_evidence = self._parse_multi_expert_response(claim, expert_response)
             expert_evidence_list.append(expert_evidence)
             
-            print(f"   ✅ Multi-expert analysis complete for claim")
+            print(f"   ✅ Multi-expert analysis complete for claim: {claim[:60]}...")
         
         return expert_evidence_list
     
@@ -165,17 +172,17 @@ class EnhancedStage2Expert:
         all_methodological = []
         all_limitations = []
         
+        prompts = []
         for section_name, section_content in technical_sections.items():
             print(f"   🔍 Deep diving into {section_name}...")
             
             # Generate technical deep dive prompt
-            deep_dive_prompt = self.expert_prompts.generate_technical_deep_dive_prompt(
+            prompts.append(self.expert_prompts.generate_technical_deep_dive_prompt(
                 section_content, field
-            )
-            
-            # Get deep technical analysis
-            technical_response = self._call_ollama(deep_dive_prompt, max_length=4000)
-            
+            ))
+        
+        # Get deep technical analysis for every section at once
+        for technical_response in call_many(lambda prompt: self._call_ollama(prompt, max_length=4000), prompts):
             # Parse technical details
             technical_details = self._parse_technical_deep_dive(technical_response)
             
@@ -277,17 +284,25 @@ class EnhancedStage2Expert:
         
         field = core_understanding.field_classification
         
-        # Expert evidence analysis
-        expert_evidence = self.expert_evidence_analysis(core_understanding, full_text)
-        
-        # Field controversy analysis
-        field_controversies = self.field_controversy_analysis(core_understanding, full_text)
-        
-        # Technical deep dive
-        technical_deep_dive = self.expert_technical_deep_dive(full_text, field)
-        
-        # Comparative analysis
-        comparative_analysis = self.comparative_field_analysis(full_text, field)
+        # The four analyses only depend on Stage 1, so run them side by side;
+        # _call_ollama's semaphore keeps the total in-flight requests bounded
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # Expert evidence analysis
+            evidence_job = executor.submit(self.expert_evidence_analysis, core_understanding, full_text)
+            
+            # Field controversy analysis
+            controversy_job = executor.submit(self.field_controversy_analysis, core_understanding, full_text)
+            
+            # Technical deep dive
+            deep_dive_job = executor.submit(self.expert_technical_deep_dive, full_text, field)
+            
+            # Comparative analysis
+            comparative_job = executor.submit(self.comparative_field_analysis, full_text, field)
+            
+            expert_evidence = evidence_job.result()
+            field_controversies = controversy_job.result()
+            technical_deep_dive = deep_dive_job.result()
+            comparative_analysis = comparative_job.result()
         
         # Generate debate scenarios
         debate_scenarios = self.generate_expert_debate_scenarios(
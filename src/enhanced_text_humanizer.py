@@ -11,6 +11,8 @@ import re
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+from config import MODEL_NAME, OLLAMA_BASE_URL
+
 
 @dataclass
 class CleanupResult:
@@ -26,7 +28,7 @@ class CleanupResult:
 class EnhancedTextHumanizer:
     """Multi-stage text cleanup and humanization system"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
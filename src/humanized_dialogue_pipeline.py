@@ -9,6 +9,7 @@ Keeps structure but adds humanization layer for authentic academic conversations
 import sys
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 from dataclasses import dataclass
@@ -20,9 +21,36 @@ from integrated_enhanced_pipeline import (
     ConversationScript,
     ConversationTurn
 )
+from config import MODEL_NAME
+from ollama_http import OLLAMA_BASE_URL, post_generate
+
+# Category labels the analysis stages put in front of debate points and
+# ammunition; only these are stripped, so speaker names and sentences that
+# merely look like "Title Case: " survive
+CATEGORY_LABELS = (
+    "lack of context", "segmentation fault", "sample size issue", "statistical problem",
+    "statistical issue", "statistical analysis", "methodology concern", "methodological concern",
+    "evidence gap", "evidence assessment", "evidence strength", "weak evidence for key claim",
+    "weak evidence", "strong evidence", "contradictory finding", "impressive performance",
+    "significant limitation", "rigorous validation", "potential bias", "scope dispute",
+    "innovation claim", "reproducibility problem", "validity concern", "generalization problem",
+    "data quality", "data analysis", "experimental design", "control group", "bias detection",
+    "confounding variable", "technical issue", "critical analysis", "research finding",
+    "algorithm performance",
+)
+
+# One pass per line strips any run of those labels, bare or after a list
+# marker ("WEAK EVIDENCE: ", "1. Sample Size Issues: ", "- Statistical Problems: ");
+# a label never spans a line break
+CATEGORY_LABEL_RE = re.compile(
+    r'^(?:(?:\d+\.|-)?[ \t]*(?:'
+    + "|".join(label.replace(" ", r"[ \t]+") for label in sorted(CATEGORY_LABELS, key=len, reverse=True))
+    + r')s?:[ \t]*)+',
+    re.MULTILINE | re.IGNORECASE
+)
 
 
-@dataclass
+@dataclass(frozen=True)
 class VoiceProfile:
     name: str
     voice_id: str
@@ -30,12 +58,28 @@ class VoiceProfile:
     gender: str
 
 
+@lru_cache(maxsize=64)
+def _voice_profile_key(speaker: str) -> str:
+    """Map a speaker name to its voice_profiles key (cached: called once per dialogue turn)"""
+    
+    speaker_lower = speaker.lower()
+    
+    if "narrator" in speaker_lower or "host" in speaker_lower:
+        return "host"
+    elif "ava" in speaker_lower or "sarah" in speaker_lower:
+        return "dr_ava"
+    elif "marcus" in speaker_lower or "webb" in speaker_lower:
+        return "prof_marcus"
+    else:
+        return "host"  # Default
+
+
 class HumanizedDialogueRefiner:
     """Refines dialogue to sound more human and natural"""
     
-    def __init__(self, ollama_model: str = "llama3.1:8b"):
+    def __init__(self, ollama_model: str = MODEL_NAME):
         self.ollama_model = ollama_model
-        self.api_url = "http://localhost:11434/api/generate"
+        self.api_url = f"{OLLAMA_BASE_URL}/api/generate"
         
         # CORRECTED: Voice assignments based on your specifications
         self.voice_profiles = {
@@ -51,9 +95,6 @@ class HumanizedDialogueRefiner:
     
     def _call_ollama(self, prompt: str, max_length: int = 800) -> str:
         """Call Ollama for humanization"""
-        import requests
-        import json
-        
         payload = {
             "model": self.ollama_model,
             "prompt": prompt,
@@ -66,7 +107,7 @@ class HumanizedDialogueRefiner:
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=60)
+            response = post_generate(self.api_url, payload, timeout=60)
             response.raise_for_status()
             result = response.json()
             return result.get("response", "").strip()
@@ -90,20 +131,7 @@ class HumanizedDialogueRefiner:
     
     def remove_category_labels(self, text: str) -> str:
         """Remove category label prefixes that make dialogue robotic"""
-        
-        # Common category labels to remove
-        category_patterns = [
-            r'^[A-Z][a-z\s]+:\s*',  # "Lack of context: ", "Segmentation Faults: "
-            r'^[A-Z][A-Z\s]+:\s*',  # "WEAK EVIDENCE: "
-            r'^\d+\.\s*[A-Z][^:]+:\s*',  # "1. Sample Size Issues: "
-            r'^-\s*[A-Z][^:]+:\s*',  # "- Statistical Problems: "
-        ]
-        
-        cleaned = text
-        for pattern in category_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.MULTILINE)
-        
-        return cleaned.strip()
+        return CATEGORY_LABEL_RE.sub('', text).strip()
     
     def humanize_introduction(self, introduction: str, research_field: str, 
                             paper_topic: str, key_finding: str) -> str:
@@ -311,17 +339,7 @@ NATURAL CONCLUSION:"""
     
     def get_voice_profile(self, speaker: str) -> VoiceProfile:
         """Get correct voice profile for speaker"""
-        
-        speaker_lower = speaker.lower()
-        
-        if "narrator" in speaker_lower or "host" in speaker_lower:
-            return self.voice_profiles["host"]
-        elif "ava" in speaker_lower or "sarah" in speaker_lower:
-            return self.voice_profiles["dr_ava"]
-        elif "marcus" in speaker_lower or "webb" in speaker_lower:
-            return self.voice_profiles["prof_marcus"]
-        else:
-            return self.voice_profiles["host"]  # Default
+        return self.voice_profiles[_voice_profile_key(speaker)]
 
 
 class HumanizedEnhancedPipeline:
@@ -0,0 +1,71 @@
+"""
+Shared Ollama HTTP Session
+Save as: src/ollama_http.py
+
+One pooled keep-alive session for every analyzer that talks to `ollama serve`,
+so repeated prompts reuse TCP connections instead of reconnecting each time.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Server address comes from config (re-exported for the analyzers)
+from config import OLLAMA_BASE_URL
+
+# How long the server keeps a model resident after a request (Ollama's own default is 5m)
+OLLAMA_KEEP_ALIVE = os.environ.get("OLLAMA_KEEP_ALIVE", "30m")
+
+# Requests the server runs at once; every analyzer in the process draws on
+# one pool of slots, so concurrent stages never oversubscribe the server
+OLLAMA_NUM_PARALLEL = max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")))
+OLLAMA_SLOTS = threading.BoundedSemaphore(OLLAMA_NUM_PARALLEL)
+
+
+def _build_session() -> requests.Session:
+    """Keep-alive session sized for the concurrent Stage 2 fan-out"""
+    session = requests.Session()
+    # Only connection failures are retried; a timed-out generation is not re-sent
+    retries = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=40, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = _build_session()
+
+
+def post_generate(api_url: str, payload: dict, timeout: float, stream: bool = False) -> requests.Response:
+    """POST to /api/generate through the shared session (connect timeout kept short)
+
+    Ollama applies keep_alive per request, so every call carries it; otherwise
+    each request would reset the model's expiry to the server's 5m default.
+    """
+    payload.setdefault("keep_alive", OLLAMA_KEEP_ALIVE)
+    return SESSION.post(api_url, json=payload, timeout=(10, timeout), stream=stream)
+
+
+def call_many(call: Callable[[str], str], prompts: List[str]) -> List[str]:
+    """Run call(prompt) for independent prompts concurrently; answers come back in prompt order"""
+    if len(prompts) <= 1:
+        return [call(prompt) for prompt in prompts]
+
+    with ThreadPoolExecutor(max_workers=min(OLLAMA_NUM_PARALLEL, len(prompts))) as executor:
+        return list(executor.map(call, prompts))
+
+
+def prewarm(model_name: str, base_url: str = OLLAMA_BASE_URL, keep_alive: str = OLLAMA_KEEP_ALIVE) -> bool:
+    """Load a model and pin it for keep_alive, so later stages skip the cold load"""
+    payload = {"model": model_name, "prompt": "", "keep_alive": keep_alive}
+    try:
+        response = post_generate(f"{base_url}/api/generate", payload, timeout=300)
+        response.raise_for_status()
+        return True
+    except Exception:
+        return False
@@ -1,9 +1,23 @@
 """Extract and clean text from research paper PDFs"""
 
 import PyPDF2
+import io
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Union
+
+from pipeline_cache import disk_cache
+
+# Prefer the C++ pdfium backend when installed; PyPDF2 stays the fallback
+try:
+    import pypdfium2 as pdfium
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
+
+# Part of the extraction cache key: bump when extraction/cleaning changes.
+# The backend is included because pdfium and PyPDF2 produce different text.
+EXTRACTION_VERSION = f"1-{'pdfium' if HAS_PDFIUM else 'pypdf2'}"
 
 
 class PDFProcessor:
@@ -14,20 +28,39 @@ class PDFProcessor:
             "acknowledgments", "appendix"
         ]
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract all text from a PDF file"""
-        try:
-            with open(pdf_path, 'rb') as file:
+    def iter_pages(self, pdf_path: Union[str, bytes]) -> Iterator[str]:
+        """Yield the raw text of each page, one page at a time
+        
+        Accepts a file path or the PDF's bytes already in memory.
+        """
+        if HAS_PDFIUM:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    yield textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        else:
+            source = io.BytesIO(pdf_path) if isinstance(pdf_path, bytes) else open(pdf_path, 'rb')
+            with source as file:
                 reader = PyPDF2.PdfReader(file)
-                text = ""
-                
-                for page_num, page in enumerate(reader.pages):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += f"\n--- Page {page_num + 1} ---\n"
-                        text += page_text
-                
-                return self._clean_text(text)
+                for page in reader.pages:
+                    yield page.extract_text()
+    
+    def extract_text_from_pdf(self, pdf_path: Union[str, bytes]) -> str:
+        """Extract all text from a PDF file (path or bytes)"""
+        try:
+            # Build the text in one join instead of repeated string appends
+            text = "".join(
+                f"\n--- Page {page_num} ---\n{page_text}"
+                for page_num, page_text in enumerate(self.iter_pages(pdf_path), 1)
+                if page_text
+            )
+            
+            return self._clean_text(text)
                 
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
@@ -131,8 +164,15 @@ class PDFProcessor:
         """Complete processing pipeline for a research paper"""
         print(f"Processing paper: {pdf_path}")
         
+        # One read: the same bytes feed both the cache key and the extraction
+        return self.process_paper_bytes(Path(pdf_path).read_bytes())
+    
+    @disk_cache(version=EXTRACTION_VERSION)
+    def process_paper_bytes(self, data: bytes) -> Dict:
+        """Complete processing pipeline for a PDF already read into memory"""
+        
         # Extract text
-        raw_text = self.extract_text_from_pdf(pdf_path)
+        raw_text = self.extract_text_from_pdf(data)
         print(f"Extracted {len(raw_text):,} characters")
         
         # Extract sections
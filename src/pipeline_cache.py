@@ -0,0 +1,115 @@
+"""
+Pipeline Disk Cache
+Save as: src/pipeline_cache.py
+
+Content-addressed pickle cache for the expensive pipeline steps that only
+depend on their inputs (PDF extraction, section detection, Stage 1), so
+reruns against the same paper skip straight to the stage under test.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+CACHE_DIR = Path(os.environ.get("PIPELINE_CACHE_DIR", ".cache"))
+
+# PIPELINE_NO_CACHE=1 / PAPER_NARRATOR_NOCACHE=1 (or --no-cache in the test
+# scripts) bypasses the cache
+_enabled = not (os.environ.get("PIPELINE_NO_CACHE") or os.environ.get("PAPER_NARRATOR_NOCACHE"))
+
+
+def disable():
+    """Turn the cache off for the rest of the process"""
+    global _enabled
+    _enabled = False
+
+
+class Uncached:
+    """Returned by a cached function to hand back `value` without storing it"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def _unwrap(result: Any) -> Any:
+    """The value to hand back for a function's raw result"""
+    return result.value if isinstance(result, Uncached) else result
+
+
+def file_sha256(path) -> str:
+    """Hash a file's contents, so a changed paper never hits a stale entry"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _fingerprint(value: Any) -> str:
+    """Stable key part for one argument; file paths and bytes hash by content"""
+    if isinstance(value, (bytes, bytearray)):
+        return f"bytes:{hashlib.sha256(value).hexdigest()}"
+    if isinstance(value, (str, Path)) and len(str(value)) < 4096 and os.path.isfile(value):
+        return f"file:{file_sha256(value)}"
+    return repr(value)
+
+
+def disk_cache(path=CACHE_DIR, cache_if: Optional[Callable[[Any], bool]] = None, version: str = ""):
+    """Cache a function's result on disk, keyed by its name and arguments
+
+    On methods, `self` is left out of the key except for its model_name,
+    so analyzers running different models never share entries; instances
+    with `use_disk_cache = False` always recompute. Results wrapped in
+    Uncached (e.g. failed Ollama calls) or rejected by `cache_if` are
+    returned but not stored. Bump `version` when the function's output
+    changes for the same input.
+    """
+
+    def decorator(func):
+        is_method = "." in func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            owner, call_args = (args[0], args[1:]) if is_method else (None, args)
+            if not _enabled or not getattr(owner, "use_disk_cache", True):
+                return _unwrap(func(*args, **kwargs))
+
+            key_parts = [func.__module__, func.__qualname__, version, repr(getattr(owner, "model_name", None))]
+            key_parts += [_fingerprint(arg) for arg in call_args]
+            key_parts += [f"{name}={_fingerprint(value)}" for name, value in sorted(kwargs.items())]
+            key = hashlib.sha256("\x1f".join(key_parts).encode("utf-8")).hexdigest()
+
+            cache_file = Path(path) / f"{key}.pkl"
+            if cache_file.exists():
+                try:
+                    with open(cache_file, 'rb') as f:
+                        result = pickle.load(f)
+                    print(f"💾 Cache hit: {func.__qualname__}")
+                    return result
+                except Exception:
+                    pass  # Unreadable or outdated entry; recompute below
+
+            result = func(*args, **kwargs)
+            if isinstance(result, Uncached):
+                return result.value
+
+            if cache_if is None or cache_if(result):
+                try:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    temp_file = cache_file.with_suffix(".tmp")
+                    with open(temp_file, 'wb') as f:
+                        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(temp_file, cache_file)
+                except Exception as e:
+                    print(f"⚠️ Could not cache {func.__qualname__}: {e}")
+
+            return result
+
+        return wrapper
+
+    return decorator
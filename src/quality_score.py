@@ -0,0 +1,35 @@
+"""
+Expert Analysis Quality Score
+Save as: src/quality_score.py
+
+Threshold rubric for scoring a Stage 2 expert analysis, shared by the depth
+test and any batch evaluation over many papers.
+"""
+
+from typing import List, Sequence, Tuple
+
+QUALITY_MAX_SCORE = 25
+
+# One entry per count in compute_quality's input, in order:
+# evidence analyses, field controversies, technical details,
+# multi-expert perspectives, debate scenarios, detailed strength assessments.
+# Each tier is (minimum count, points, label); the first tier reached wins.
+QUALITY_RUBRIC = (
+    ((2, 5, "Multiple expert evidence analyses"), (1, 3, "Basic expert evidence analysis")),
+    ((8, 5, "Comprehensive field controversies identified"), (4, 3, "Good field controversy coverage")),
+    ((10, 5, "Maximum technical granularity achieved"), (5, 3, "Good technical detail extraction")),
+    ((2, 4, "Multi-expert perspective analysis"), (1, 2, "Basic expert perspective analysis")),
+    ((3, 3, "Multiple expert debate scenarios"), (1, 2, "Basic debate scenarios")),
+    ((1, 3, "Detailed evidence strength assessment"),),
+)
+
+
+def compute_quality(counts: Sequence[int]) -> Tuple[int, List[Tuple[int, str]]]:
+    """Score the six analysis counts; returns (score, [(points, label), ...]) for awarded tiers"""
+    awarded = []
+    for count, tiers in zip(counts, QUALITY_RUBRIC):
+        for minimum, points, label in tiers:
+            if count >= minimum:
+                awarded.append((points, label))
+                break
+    return sum(points for points, _ in awarded), awarded
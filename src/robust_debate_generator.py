@@ -12,18 +12,30 @@ Auto-detects complexity and chooses appropriate mechanism for reliable productio
 import requests
 import json
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+from config import MODEL_NAME
+from ollama_http import OLLAMA_BASE_URL, OLLAMA_NUM_PARALLEL, OLLAMA_SLOTS, call_many, post_generate
+
 # Import previous stages
 from two_stage_analyzer import CompleteAnalysis
 from enhanced_analyzer import CoreUnderstanding
 from stage2_evidence_hunter import ComprehensiveEvidence
 
+# Debate and turn dataclasses declare __slots__ (no per-instance __dict__);
+# slots=True needs Python 3.10
+
 
 @dataclass
 class RobustDebateTurn:
     """Debate turn compatible with both mechanisms"""
+    __slots__ = (
+        'speaker', 'speaker_role', 'content', 'evidence_cited', 'technical_depth',
+        'argument_type', 'turn_number', 'generation_method'
+    )
+    
     speaker: str
     speaker_role: str
     content: str
@@ -37,6 +49,12 @@ class RobustDebateTurn:
 @dataclass
 class RobustDebate:
     """Robust debate with fallback tracking"""
+    __slots__ = (
+        'paper_title', 'field', 'debate_topics', 'turns', 'evidence_citations',
+        'technical_concepts_discussed', 'total_turns', 'sophistication_score',
+        'generation_method', 'complexity_reasons'
+    )
+    
     paper_title: str
     field: str
     debate_topics: List[str]
@@ -63,7 +81,7 @@ class ComplexityAssessment:
 class RobustDebateGenerator:
     """Dual-mechanism debate generator with auto-fallback"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
@@ -92,7 +110,8 @@ class RobustDebateGenerator:
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=timeout)
+            with OLLAMA_SLOTS:
+                response = post_generate(self.api_url, payload, timeout=timeout)
             response.raise_for_status()
             result = response.json()
             return result.get("response", "").strip()
@@ -101,6 +120,20 @@ class RobustDebateGenerator:
         except Exception as e:
             return f"[API Error: {str(e)}]"
     
+    def _run_topics(self, generate_topic, topics: List, exchanges_per_topic: int) -> List:
+        """Generate each topic's exchange concurrently, in topic order
+        
+        Topics are independent, and each yields a fixed number of turns,
+        so every topic knows its starting turn number up front.
+        """
+        turns_per_topic = max(2, exchanges_per_topic)
+        with ThreadPoolExecutor(max_workers=min(OLLAMA_NUM_PARALLEL, max(1, len(topics)))) as executor:
+            jobs = [
+                executor.submit(generate_topic, topic, 1 + topic_idx * turns_per_topic)
+                for topic_idx, topic in enumerate(topics)
+            ]
+            return [job.result() for job in jobs]
+    
     def assess_complexity(self, complete_analysis: CompleteAnalysis) -> ComplexityAssessment:
         """Assess paper complexity to choose generation mechanism"""
         
@@ -242,21 +275,21 @@ class RobustDebateGenerator:
         
         # Generate sophisticated debate turns
         turns = []
-        turn_number = 1
         evidence_citations = []
         technical_concepts = []
         
-        for topic_idx, topic in enumerate(debate_topics):
-            print(f"   🎯 Topic {topic_idx + 1}: Sophisticated exchanges")
-            
-            topic_turns, topic_evidence, topic_concepts = self._generate_sophisticated_topic_debate(
-                topic, complete_analysis, personalities, exchanges_per_topic, turn_number
-            )
-            
+        print(f"   🎯 {len(debate_topics)} topics: Sophisticated exchanges")
+        topic_results = self._run_topics(
+            lambda topic, start_turn: self._generate_sophisticated_topic_debate(
+                topic, complete_analysis, personalities, exchanges_per_topic, start_turn
+            ),
+            debate_topics, exchanges_per_topic
+        )
+        
+        for topic_turns, topic_evidence, topic_concepts in topic_results:
             turns.extend(topic_turns)
             evidence_citations.extend(topic_evidence)
             technical_concepts.extend(topic_concepts)
-            turn_number += len(topic_turns)
         
         # Calculate sophistication score
         sophistication_score = self._calculate_sophistication_score(turns, evidence_citations, technical_concepts)
@@ -295,25 +328,25 @@ class RobustDebateGenerator:
         topics = stage1_debates[:max_topics]
         
         turns = []
-        turn_number = 1
         evidence_citations = []
         technical_concepts = []
         
         # Generate simplified but intelligent exchanges
-        for topic_idx, topic in enumerate(topics):
-            print(f"   🎯 Topic {topic_idx + 1}: Simplified exchanges")
-            
-            topic_turns = self._generate_simplified_topic_debate(
-                topic, complete_analysis, personalities, exchanges_per_topic, turn_number
-            )
-            
+        print(f"   🎯 {len(topics)} topics: Simplified exchanges")
+        topic_results = self._run_topics(
+            lambda topic, start_turn: self._generate_simplified_topic_debate(
+                topic, complete_analysis, personalities, exchanges_per_topic, start_turn
+            ),
+            topics, exchanges_per_topic
+        )
+        
+        for topic_turns in topic_results:
             # Extract citations and concepts from turns
             for turn in topic_turns:
                 evidence_citations.extend(self._extract_citations(turn.content))
                 technical_concepts.extend(self._extract_technical_concepts(turn.content))
             
             turns.extend(topic_turns)
-            turn_number += len(topic_turns)
         
         # Calculate score (will be lower but still decent)
         sophistication_score = self._calculate_sophistication_score(turns, evidence_citations, technical_concepts)
@@ -371,9 +404,10 @@ As a skeptic who focuses on methodological rigor, give a brief critical response
 
 {personalities["skeptic"]["name"]}:"""
         
-        # Generate responses
-        optimist_response = self._call_ollama(optimist_prompt, max_length=400)
-        skeptic_response = self._call_ollama(skeptic_prompt, max_length=400)
+        # Generate responses (the skeptic prompt doesn't quote the optimist, so both go at once)
+        optimist_response, skeptic_response = call_many(
+            lambda prompt: self._call_ollama(prompt, max_length=400), [optimist_prompt, skeptic_prompt]
+        )
         
         # Create turns
         turns.append(RobustDebateTurn(
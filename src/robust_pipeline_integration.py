@@ -11,17 +11,49 @@ PRODUCTION-READY integration with dual-mechanism debate generation:
 REPLACES: dialogue_generator_fixed.py with robust production system
 """
 
-from typing import Dict, List, Tuple
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
+
+from config import MODEL_NAME
+from ollama_http import OLLAMA_BASE_URL
 
 # Import robust system components
 from two_stage_analyzer import TwoStageAnalyzer, CompleteAnalysis
 from robust_debate_generator import RobustDebateGenerator, RobustDebate
 
 
+class _PerThreadStdout:
+    """sys.stdout stand-in that sends registered threads' prints to their own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+    
+    def write(self, text: str) -> int:
+        return self.buffers.get(threading.get_ident(), self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+
+# Script and turn dataclasses declare __slots__ (no per-instance __dict__),
+# since every setting's script is retained; slots=True needs Python 3.10
+
+
 @dataclass
 class RobustConversationScript:
     """Production-ready conversation script with robust generation tracking"""
+    __slots__ = (
+        'title', 'paper_topic', 'introduction', 'turns', 'conclusion', 'total_turns',
+        'duration_estimate', 'sophistication_score', 'evidence_citations', 'generation_method',
+        'production_quality'
+    )
+    
     title: str
     paper_topic: str
     introduction: str
@@ -38,6 +70,11 @@ class RobustConversationScript:
 @dataclass
 class RobustConversationTurn:
     """Enhanced turn with production tracking"""
+    __slots__ = (
+        'speaker', 'speaker_role', 'content', 'topic', 'turn_number', 'evidence_cited',
+        'technical_depth', 'argument_type', 'generation_method'
+    )
+    
     speaker: str
     speaker_role: str
     content: str
@@ -52,29 +89,35 @@ class RobustConversationTurn:
 class RobustPipelineIntegration:
     """PRODUCTION-READY integration with auto-fallback"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.two_stage_analyzer = TwoStageAnalyzer(model_name, base_url)
         self.robust_debate_generator = RobustDebateGenerator(model_name, base_url)
         
+        # The two-stage analysis only depends on the paper text, so repeated
+        # conversations for the same paper (e.g. a settings grid) reuse it
+        self._analyze_text = lru_cache(maxsize=4)(self.two_stage_analyzer.analyze_paper_complete)
+        
         print("🛡️ Robust Pipeline Integration Initialized")
         print("   🎯 Auto-detects complexity and chooses optimal generation method")
         print("   ✅ Guarantees successful content generation")
     
     def create_robust_conversation(self, paper_data: Dict, 
                                  max_topics: int = 3, 
-                                 exchanges_per_topic: int = 4) -> RobustConversationScript:
+                                 exchanges_per_topic: int = 4,
+                                 complete_analysis: CompleteAnalysis = None) -> RobustConversationScript:
         """
         PRODUCTION ENTRY POINT: Create robust conversation with auto-fallback
         
         Always succeeds - uses sophisticated when possible, simplified when needed.
         Same interface as existing system but with robust production guarantees.
+        Pass a precomputed complete_analysis to generate several scripts from one analysis.
         """
         
         print("🚀 Creating robust production-ready conversation...")
         
-        # Step 1: Run comprehensive two-stage analysis
-        raw_text = paper_data["raw_text"]
-        complete_analysis = self.two_stage_analyzer.analyze_paper_complete(raw_text)
+        # Step 1: Run comprehensive two-stage analysis (unless the caller already has it)
+        if complete_analysis is None:
+            complete_analysis = self._prepare_analysis(paper_data)
         
         print(f"📊 Analysis quality: {complete_analysis.analysis_quality_score}/20")
         
@@ -100,6 +143,54 @@ class RobustPipelineIntegration:
         
         return conversation_script
     
+    def create_robust_conversation_grid(self, paper_data: Dict,
+                                      grid: List[Tuple[int, int]]) -> List[Union[RobustConversationScript, Exception]]:
+        """
+        Create one conversation per (max_topics, exchanges_per_topic) setting
+        
+        The two-stage analysis runs once; only debate generation varies per
+        setting, and the settings run side by side (the shared Ollama slots
+        bound the requests). Each setting's progress output is collected and
+        printed in grid order. A setting that fails - or every setting, if the
+        shared analysis fails - yields its exception in place of a script.
+        """
+        
+        try:
+            complete_analysis = self._prepare_analysis(paper_data)
+        except Exception as e:
+            print(f"❌ Analysis failed for all {len(grid)} settings: {e}")
+            return [e] * len(grid)
+        
+        stdout = _PerThreadStdout(sys.stdout)
+        
+        def create(setting: Tuple[int, int]) -> Tuple[Union[RobustConversationScript, Exception], str]:
+            max_topics, exchanges_per_topic = setting
+            output = stdout.buffers[threading.get_ident()] = io.StringIO()
+            try:
+                script = self.create_robust_conversation(paper_data, max_topics, exchanges_per_topic, complete_analysis)
+                return script, output.getvalue()
+            except Exception as e:
+                return e, output.getvalue()
+            finally:
+                del stdout.buffers[threading.get_ident()]
+        
+        results = []
+        sys.stdout = stdout
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, len(grid))) as executor:
+                # map yields in grid order, so each setting prints as soon as it and those before it finish
+                for (max_topics, exchanges_per_topic), (result, output) in zip(grid, executor.map(create, grid)):
+                    print(f"\n📋 Setting: {max_topics} topics, {exchanges_per_topic} exchanges per topic")
+                    print(output, end="")
+                    results.append(result)
+        finally:
+            sys.stdout = stdout.stream
+        return results
+    
+    def _prepare_analysis(self, paper_data: Dict) -> CompleteAnalysis:
+        """Two-stage analysis of the paper, memoized on its raw text"""
+        return self._analyze_text(paper_data["raw_text"])
+    
     def _convert_to_production_script(self, robust_debate: RobustDebate, 
                                     complete_analysis: CompleteAnalysis) -> RobustConversationScript:
         """Convert robust debate to production conversation script"""
@@ -266,7 +357,7 @@ class RobustDialogueEngine:
     SAME INTERFACE as existing system - just change the import!
     """
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.integration = RobustPipelineIntegration(model_name, base_url)
         
         print("🛡️ Robust Dialogue Engine Initialized")
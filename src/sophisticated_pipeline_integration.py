@@ -15,6 +15,7 @@ from dataclasses import dataclass
 # Import existing system components
 from two_stage_analyzer import TwoStageAnalyzer, CompleteAnalysis
 from stage3_sophisticated_debates import Stage3SophisticatedDebates, SophisticatedDebate
+from config import MODEL_NAME, OLLAMA_BASE_URL
 
 
 @dataclass
@@ -47,7 +48,7 @@ class SophisticatedConversationTurn:
 class SophisticatedPipelineIntegration:
     """Integration layer for sophisticated analysis with YouTube pipeline"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.two_stage_analyzer = TwoStageAnalyzer(model_name, base_url)
         self.debate_generator = Stage3SophisticatedDebates(model_name, base_url)
     
@@ -202,7 +203,7 @@ Thanks for joining us on Research Rundown. Subscribe for more evidence-based ana
 class SophisticatedDialogueEngine:
     """DROP-IN REPLACEMENT for FixedDialogueEngine in your existing system"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.integration = SophisticatedPipelineIntegration(model_name, base_url)
     
     def create_full_conversation(self, analysis_results: Dict, 
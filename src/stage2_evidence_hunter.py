@@ -6,15 +6,45 @@ Uses Stage 1 core understanding to hunt for evidence throughout the full paper.
 Maps claims to supporting/contradictory evidence for sophisticated debates.
 """
 
-import requests
 import json
 import re
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+from config import MODEL_NAME
+from ollama_http import OLLAMA_BASE_URL, OLLAMA_NUM_PARALLEL, OLLAMA_SLOTS, post_generate
+
 # Import Stage 1 results
 from enhanced_analyzer import CoreUnderstanding
 
+# Claim-focused evidence: each claim's content words are located in the paper
+# (one regex pass for all claims), its rarest ones there pick the passages, and
+# the text around them becomes that claim's evidence context
+CLAIM_KEYWORDS_PER_CLAIM = 3
+EVIDENCE_WINDOW_RADIUS = 200
+CLAIM_CONTEXT_LENGTH = 2400
+# Inner hyphens only ("state-of-the-art"), so every token can match between \b anchors
+_CLAIM_WORD_RE = re.compile(r"[A-Za-z][A-Za-z-]*[A-Za-z]")
+CLAIM_WORD_MIN_LENGTH = 4
+_CLAIM_STOPWORDS = frozenset([
+    "about", "across", "also", "although", "based", "been", "being", "both", "can", "could",
+    "does", "each", "from", "have", "into", "more", "most", "much", "only", "other", "over",
+    "paper", "should", "show", "shows", "such", "than", "that", "their", "them", "then",
+    "there", "these", "they", "this", "those", "through", "using", "very", "well", "were",
+    "what", "when", "where", "which", "while", "will", "with", "within", "would", "study",
+    "results", "approach", "method", "authors", "research", "work", "findings", "significant",
+    # Hedges and intensifiers: rare in a paper, but they say nothing about the topic
+    "substantially", "significantly", "dramatically", "considerably", "remarkably", "notably",
+    "particularly", "approximately", "relatively", "highly", "greatly", "largely", "mainly",
+    "clearly", "consistently", "generally", "potentially", "previously", "respectively",
+    "specifically", "successfully", "strongly", "widely", "novel", "demonstrate", "demonstrates",
+    "demonstrated", "propose", "proposed", "proposes", "present", "presents", "presented",
+    "improve", "improves", "improved", "improvement", "improvements",
+])
+
 
 @dataclass
 class EvidenceMapping:
@@ -63,7 +93,7 @@ class ComprehensiveEvidence:
 class Stage2EvidenceHunter:
     """Stage 2: Hunt for evidence using Stage 1 understanding"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
@@ -82,7 +112,8 @@ class Stage2EvidenceHunter:
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=400)  # Longer timeout for full paper
+            with OLLAMA_SLOTS:
+                response = post_generate(self.api_url, payload, timeout=400)  # Longer timeout for full paper
             response.raise_for_status()
             result = response.json()
             return result.get("response", "").strip()
@@ -197,8 +228,14 @@ class Stage2EvidenceHunter:
         return None
     
     def evidence_claim_mapping(self, core_understanding: CoreUnderstanding, 
-                             full_sections: Dict[str, str]) -> List[EvidenceMapping]:
-        """Map claims from Stage 1 to evidence in full paper"""
+                             full_sections: Dict[str, str],
+                             full_text: Optional[str] = None) -> List[EvidenceMapping]:
+        """Map claims from Stage 1 to evidence in full paper
+        
+        With full_text, each claim is checked against the passages around its
+        own keywords; claims without hits (or without full_text) get the
+        shared section context.
+        """
         
         print("🔍 Stage 2: Mapping claims to evidence...")
         
@@ -222,20 +259,47 @@ class Stage2EvidenceHunter:
         
         print(f"📋 Found {len(main_claims)} main claims to verify")
         
-        evidence_mappings = []
+        # The evidence context is the same for every claim
+        evidence_context = self._prepare_evidence_context(full_sections)
+        
+        claims = [claim for claim in main_claims if len(claim) >= 30]  # Skip very short claims
+        claim_contexts = self._claim_evidence_windows(claims, full_text) if full_text else {}
+        if full_text:
+            print(f"📌 {len(claim_contexts)}/{len(claims)} claims use keyword passages; "
+                  f"the rest use the shared section context")
+        
+        # Claims are independent: each is verified and parsed in its own worker,
+        # and results keep the claims' order
+        if len(claims) <= 1:
+            evidence_mappings = [
+                self._map_claim_evidence(claim, claim_contexts.get(claim, evidence_context), full_sections)
+                for claim in claims
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=min(OLLAMA_NUM_PARALLEL, len(claims))) as executor:
+                evidence_mappings = list(executor.map(
+                    lambda claim: self._map_claim_evidence(
+                        claim, claim_contexts.get(claim, evidence_context), full_sections
+                    ),
+                    claims
+                ))
         
-        for claim in main_claims:
-            if len(claim) < 30:  # Skip very short claims
-                continue
-                
-            # Create evidence mapping prompt
-            evidence_prompt = f"""You are an expert peer reviewer conducting evidence analysis. 
+        for mapping in evidence_mappings:
+            print(f"  ✅ Mapped evidence for: {mapping.claim[:50]}... (Strength: {mapping.evidence_strength})")
+        
+        return evidence_mappings
+    
+    def _map_claim_evidence(self, claim: str, evidence_context: str, full_sections: Dict[str, str]) -> EvidenceMapping:
+        """Verify one claim against the evidence context and parse the mapping"""
+        
+        # Create evidence mapping prompt
+        evidence_prompt = f"""You are an expert peer reviewer conducting evidence analysis. 
 
 SPECIFIC CLAIM TO VERIFY:
 "{claim}"
 
 FULL PAPER SECTIONS FOR EVIDENCE:
-{self._prepare_evidence_context(full_sections)}
+{evidence_context}
 
 TASK: Analyze whether this specific claim is supported by evidence in the paper sections.
 
@@ -260,15 +324,83 @@ REQUIRED ANALYSIS:
 - [Note specific tables, figures, or paragraphs if mentioned]
 
 Be specific and quote exact evidence. Focus only on this specific claim."""
-
-            evidence_response = self._call_ollama(evidence_prompt, max_length=2000)
-            
-            # Parse the evidence mapping
-            mapping = self._parse_evidence_mapping(claim, evidence_response, full_sections)
-            evidence_mappings.append(mapping)
-            print(f"  ✅ Mapped evidence for: {claim[:50]}... (Strength: {mapping.evidence_strength})")
         
-        return evidence_mappings
+        evidence_response = self._call_ollama(evidence_prompt, max_length=2000)
+        
+        # Parse the evidence mapping
+        return self._parse_evidence_mapping(claim, evidence_response, full_sections)
+    
+    def _claim_keywords(self, claim: str) -> List[str]:
+        """A claim's candidate content words (short words and stopwords dropped)"""
+        words = {word.lower() for word in _CLAIM_WORD_RE.findall(claim) if len(word) >= CLAIM_WORD_MIN_LENGTH}
+        return sorted(words - _CLAIM_STOPWORDS)
+    
+    def _densest_span(self, hits: List[Tuple[int, str]], start: int, end: int, length: int) -> Tuple[int, int]:
+        """The `length`-character part of [start, end) with the most distinct words, then hits"""
+        offsets = [offset for offset, _ in hits]
+        best_start, best_score = start, (0, 0)
+        for i, offset in enumerate(offsets):
+            span_start = min(max(start, offset - EVIDENCE_WINDOW_RADIUS), end - length)
+            j = bisect_left(offsets, span_start + length)
+            score = (len({kw for _, kw in hits[i:j]}), j - i)
+            if score > best_score:
+                best_start, best_score = span_start, score
+        return best_start, best_start + length
+    
+    def _claim_evidence_windows(self, claims: List[str], full_text: str,
+                                max_length: int = CLAIM_CONTEXT_LENGTH) -> Dict[str, str]:
+        """Evidence context per claim from a single scan of the paper"""
+        
+        claim_words = {claim: self._claim_keywords(claim) for claim in claims}
+        all_words = sorted({word for words in claim_words.values() for word in words}, key=len, reverse=True)
+        if not all_words:
+            return {}
+        
+        # One pass over the paper for every claim's words
+        word_re = re.compile(r"\b(" + "|".join(map(re.escape, all_words)) + r")\b", re.IGNORECASE)
+        offsets_by_word = defaultdict(list)
+        for match in word_re.finditer(full_text):
+            offsets_by_word[match.group(1).lower()].append(match.start())
+        
+        contexts = {}
+        for claim, words in claim_words.items():
+            # The claim's rarest words in this paper (longer first on ties) pin down its passages
+            found = [word for word in words if word in offsets_by_word]
+            keywords = sorted(found, key=lambda word: (len(offsets_by_word[word]), -len(word), word))
+            hits = sorted((offset, kw) for kw in keywords[:CLAIM_KEYWORDS_PER_CLAIM] for offset in offsets_by_word[kw])
+            if not hits:
+                continue
+            
+            # Merge overlapping windows, keeping the hits and distinct words inside each
+            windows = []  # [start, end, hits, words]
+            for offset, kw in hits:
+                start = max(0, offset - EVIDENCE_WINDOW_RADIUS)
+                end = min(len(full_text), offset + EVIDENCE_WINDOW_RADIUS)
+                if windows and start <= windows[-1][1]:
+                    windows[-1][1] = end
+                    windows[-1][2].append((offset, kw))
+                    windows[-1][3].add(kw)
+                else:
+                    windows.append([start, end, [(offset, kw)], {kw}])
+            
+            # Windows with more of the claim's words (then more hits) first until
+            # the budget is used, then back in paper order; a window bigger than
+            # what is left is clipped around its hits
+            chosen = []
+            used = 0
+            windows.sort(key=lambda window: (-len(window[3]), -len(window[2])))
+            for start, end, window_hits, _ in windows:
+                remaining = max_length - used
+                if end - start > remaining:
+                    if remaining < 2 * EVIDENCE_WINDOW_RADIUS:
+                        continue
+                    start, end = self._densest_span(window_hits, start, end, remaining)
+                chosen.append((start, end))
+                used += end - start
+            if chosen:
+                contexts[claim] = "\n...\n".join(full_text[start:end].strip() for start, end in sorted(chosen))
+        
+        return contexts
     
     def _prepare_evidence_context(self, sections: Dict[str, str], max_length: int = 4000) -> str:
         """Prepare relevant sections for evidence analysis"""
@@ -369,14 +501,21 @@ Be specific and quote exact evidence. Focus only on this specific claim."""
         # Step 1: Intelligent section search
         full_sections = self.intelligent_section_search(full_text, core_understanding)
         
-        # Step 2: Evidence-claim mapping
-        evidence_mappings = self.evidence_claim_mapping(core_understanding, full_sections)
-        
-        # Step 3: Technical deep dive
-        technical_analysis = self._technical_deep_dive(full_sections, core_understanding)
-        
-        # Step 4: Methodology analysis  
-        methodology_analysis = self._methodology_analysis(full_sections, core_understanding)
+        # Steps 2-4 only depend on the sections and Stage 1, so they run side by
+        # side; _call_ollama's semaphore keeps the total in-flight requests bounded
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Step 2: Evidence-claim mapping
+            mapping_job = executor.submit(self.evidence_claim_mapping, core_understanding, full_sections, full_text)
+            
+            # Step 3: Technical deep dive
+            technical_job = executor.submit(self._technical_deep_dive, full_sections, core_understanding)
+            
+            # Step 4: Methodology analysis
+            methodology_job = executor.submit(self._methodology_analysis, full_sections, core_understanding)
+            
+            evidence_mappings = mapping_job.result()
+            technical_analysis = technical_job.result()
+            methodology_analysis = methodology_job.result()
         
         # Step 5: Gap and overclaim detection
         gaps, overclaims = self._detect_gaps_and_overclaims(evidence_mappings, core_understanding)
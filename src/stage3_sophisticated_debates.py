@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from two_stage_analyzer import CompleteAnalysis
 from enhanced_analyzer import CoreUnderstanding
 from stage2_evidence_hunter import ComprehensiveEvidence
+from config import MODEL_NAME, OLLAMA_BASE_URL
 
 
 @dataclass
@@ -57,7 +58,7 @@ class ExpertPersonality:
 class Stage3SophisticatedDebates:
     """Generate expert-level academic debates using comprehensive evidence"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
@@ -5,9 +5,11 @@ import json
 import re
 from typing import Dict, List
 
+from config import MODEL_NAME, OLLAMA_BASE_URL
+
 
 class FinalFixedPaperSummarizerV2:
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
@@ -9,6 +9,9 @@ for comprehensive academic paper analysis ready for sophisticated debates.
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+from config import MODEL_NAME
+from ollama_http import OLLAMA_BASE_URL
+
 # Import both stages
 from enhanced_analyzer import EnhancedPaperAnalyzer, CoreUnderstanding
 from stage2_evidence_hunter import Stage2EvidenceHunter, ComprehensiveEvidence
@@ -26,7 +29,7 @@ class CompleteAnalysis:
 class TwoStageAnalyzer:
     """Complete two-stage paper analyzer for sophisticated AI debates"""
     
-    def __init__(self, model_name: str = "llama3.1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model_name: str = MODEL_NAME, base_url: str = OLLAMA_BASE_URL):
         self.stage1_analyzer = EnhancedPaperAnalyzer(model_name, base_url)
         self.stage2_hunter = Stage2EvidenceHunter(model_name, base_url)
     
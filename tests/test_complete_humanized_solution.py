@@ -160,9 +160,15 @@ def test_full_pipeline(pdf_path: str):
         # Specific fix validation
         print(f"\n🔍 VALIDATING SPECIFIC FIXES:")
         
+        # Look up every result field once up front
+        humanized_analysis = complete_result["humanized_analysis"]
+        voice_diff = audio_result.get("voice_differentiation", {})
+        humanization_pipeline = audio_result.get("humanization_pipeline")
+        output_file = audio_result.get("output_file")
+        
         # Check field extraction
         original_field = stage1.research_field
-        cleaned_field = complete_result["humanized_analysis"]["research_field_cleaned"]
+        cleaned_field = humanized_analysis["research_field_cleaned"]
         
         if "**" not in cleaned_field:
             print(f"   ✅ Field cleanup: ** symbols removed")
@@ -182,7 +188,6 @@ def test_full_pipeline(pdf_path: str):
             print(f"   ❌ Speaker names: Still using full name")
         
         # Check voice differentiation
-        voice_diff = audio_result.get("voice_differentiation", {})
         unique_voices = len(voice_diff)
         if unique_voices >= 3:
             print(f"   ✅ Voice differentiation: {unique_voices} distinct voices used")
@@ -190,13 +195,13 @@ def test_full_pipeline(pdf_path: str):
             print(f"   ❌ Voice differentiation: Only {unique_voices} voices used")
         
         # Check humanization
-        if audio_result.get("humanization_pipeline") == "multi_stage_complete":
+        if humanization_pipeline == "multi_stage_complete":
             print(f"   ✅ Text humanization: Multi-stage pipeline applied")
         else:
             print(f"   ❌ Text humanization: Pipeline not fully applied")
         
         # Check audio file
-        audio_file = Path(audio_result["output_file"])
+        audio_file = Path(output_file)
         if audio_file.exists():
             file_size_mb = audio_file.stat().st_size / (1024 * 1024)
             print(f"   ✅ Audio generation: File created ({file_size_mb:.1f} MB)")
@@ -11,6 +11,7 @@ Stage 3: Sophisticated Debates (Expert-level evidence-based discussions)
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src directory to path
@@ -53,15 +54,20 @@ def test_complete_three_stage_pipeline(pdf_path: str, max_topics: int = 3, excha
     two_stage_analyzer = TwoStageAnalyzer()
     debate_generator = Stage3SophisticatedDebates()
     
-    # Test all connections
+    # Test all connections (independent health pings, run concurrently)
     print(f"\n🔧 Testing connections...")
     
-    if not two_stage_analyzer.test_connection():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        analyzer_check = executor.submit(two_stage_analyzer.test_connection)
+        debate_check = executor.submit(debate_generator.test_connection)
+        analyzer_ok, debate_ok = analyzer_check.result(), debate_check.result()
+    
+    if not analyzer_ok:
         print("❌ Two-stage analyzer connection failed")
         return False
     print("✅ Two-stage analyzer ready")
     
-    if not debate_generator.test_connection():
+    if not debate_ok:
         print("❌ Debate generator connection failed")
         return False
     print("✅ Debate generator ready")
@@ -164,65 +170,54 @@ def test_complete_three_stage_pipeline(pdf_path: str, max_topics: int = 3, excha
         # ================== QUALITY ASSESSMENT ==================
         print(f"\n{'='*20} COMPLETE PIPELINE QUALITY ASSESSMENT {'='*20}")
         
-        pipeline_score = 0
+        # (points, icon, label) entries, summed and printed in one go
+        scoring = []
         max_pipeline_score = 30
         
         # Stage 1 + 2 quality (15 points)
         if complete_analysis.analysis_quality_score >= 15:
-            pipeline_score += 8
-            print("   ✅ Outstanding two-stage analysis (+8)")
+            scoring.append((8, "✅", "Outstanding two-stage analysis"))
         elif complete_analysis.analysis_quality_score >= 12:
-            pipeline_score += 6
-            print("   ✅ Excellent two-stage analysis (+6)")
+            scoring.append((6, "✅", "Excellent two-stage analysis"))
         elif complete_analysis.analysis_quality_score >= 8:
-            pipeline_score += 4
-            print("   ✅ Good two-stage analysis (+4)")
+            scoring.append((4, "✅", "Good two-stage analysis"))
         else:
-            pipeline_score += 2
-            print("   ⚠️ Basic two-stage analysis (+2)")
+            scoring.append((2, "⚠️", "Basic two-stage analysis"))
         
         # Stage 3 sophistication (15 points)
         if sophisticated_debate.sophistication_score >= 80:
-            pipeline_score += 7
-            print("   ✅ Outstanding debate sophistication (+7)")
+            scoring.append((7, "✅", "Outstanding debate sophistication"))
         elif sophisticated_debate.sophistication_score >= 60:
-            pipeline_score += 5
-            print("   ✅ High debate sophistication (+5)")
+            scoring.append((5, "✅", "High debate sophistication"))
         elif sophisticated_debate.sophistication_score >= 40:
-            pipeline_score += 3
-            print("   ✅ Moderate debate sophistication (+3)")
+            scoring.append((3, "✅", "Moderate debate sophistication"))
         else:
-            pipeline_score += 1
-            print("   ⚠️ Basic debate sophistication (+1)")
+            scoring.append((1, "⚠️", "Basic debate sophistication"))
         
         # Evidence integration quality (10 points)
         citation_density = len(sophisticated_debate.evidence_citations) / sophisticated_debate.total_turns if sophisticated_debate.total_turns else 0
         if citation_density >= 1.0:
-            pipeline_score += 5
-            print("   ✅ Excellent evidence integration (+5)")
+            scoring.append((5, "✅", "Excellent evidence integration"))
         elif citation_density >= 0.5:
-            pipeline_score += 3
-            print("   ✅ Good evidence integration (+3)")
+            scoring.append((3, "✅", "Good evidence integration"))
         elif citation_density >= 0.2:
-            pipeline_score += 2
-            print("   ✅ Basic evidence integration (+2)")
+            scoring.append((2, "✅", "Basic evidence integration"))
         
         # Technical depth integration (5 points)
         unique_concepts = len(set(sophisticated_debate.technical_concepts_discussed))
         if unique_concepts >= 8:
-            pipeline_score += 3
-            print("   ✅ High technical depth (+3)")
+            scoring.append((3, "✅", "High technical depth"))
         elif unique_concepts >= 4:
-            pipeline_score += 2
-            print("   ✅ Moderate technical depth (+2)")
+            scoring.append((2, "✅", "Moderate technical depth"))
         elif unique_concepts >= 2:
-            pipeline_score += 1
-            print("   ✅ Basic technical depth (+1)")
+            scoring.append((1, "✅", "Basic technical depth"))
         
         # Field adaptation (5 points)
         if complete_analysis.core_understanding.field_classification != "General Research":
-            pipeline_score += 2
-            print("   ✅ Field-specific adaptation (+2)")
+            scoring.append((2, "✅", "Field-specific adaptation"))
+        
+        pipeline_score = sum(points for points, _, _ in scoring)
+        print("\n".join(f"   {icon} {label} (+{points})" for points, icon, label in scoring))
         
         print(f"\n🏆 COMPLETE PIPELINE SCORE: {pipeline_score}/{max_pipeline_score}")
         
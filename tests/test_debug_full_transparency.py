@@ -10,6 +10,10 @@ Complete transparency for debugging analysis issues.
 import sys
 import os
 import re  # Added missing import
+import bisect
+import heapq
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 import time
 
@@ -17,64 +21,192 @@ import time
 sys.path.append('src')
 sys.path.append('.')
 
-# Import components
-try:
-    from pdf_processor import PDFProcessor
-    from enhanced_analyzer import EnhancedPaperAnalyzer
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    sys.exit(1)
+# Pipeline components (PDF processor, analyzer, Ollama session) are imported lazily
+# inside the debug run, so --help and smoke imports of this module stay fast.
+
+
+# Every keyword the debug section detector looks up (start and end markers)
+SECTION_KEYWORDS = (
+    'abstract', 'introduction', 'keywords', 'method', '1.',
+    'conclusion', 'conclusions', 'concluding remarks',
+    'references', 'acknowledgments', 'appendix',
+    'future work', 'future research', 'future directions',
+)
+
+
+def build_keyword_scanner(keywords):
+    """Compile one regex that reports every (possibly overlapping) keyword hit"""
+    # Longest first, so the alternation picks the longest keyword at each offset
+    ordered = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(kw) for kw in ordered) + '))')
+    # A hit on a long keyword is also a hit on every keyword that prefixes it
+    prefixes = {kw: [other for other in keywords if kw.startswith(other)] for kw in keywords}
+    return pattern, prefixes
+
+
+_SECTION_SCANNER = build_keyword_scanner(SECTION_KEYWORDS)
+
+# Abstract keywords behind the field classification check, by category
+FIELD_KEYWORD_CATEGORIES = {
+    'machine learning': 'ml', 'neural': 'ml', 'deep learning': 'ml', 'algorithm': 'ml', 'model': 'ml',
+    'network': 'network', 'graph': 'network', 'node': 'network', 'edge': 'network', 'community': 'network',
+}
+_FIELD_KEYWORD_SCANNER = build_keyword_scanner(FIELD_KEYWORD_CATEGORIES)
+
+# Title detection: first author/institution marker, and footnote symbols to drop
+_AUTHOR_RE = re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+|Computer Science Department|University)')
+_STRIP_FOOTNOTE_MARKS = str.maketrans('', '', '*†‡')
+
+# Stage 1 response sections, in the order header lines are matched against them
+_SECTION_HEADERS = (
+    ('story', ('RESEARCH STORY', 'STORY ARC'), '📖', 'Research Story'),
+    ('confidence', ('CONFIDENCE', 'ASSESSMENT'), '🔍', 'Confidence Assessment'),
+    ('field', ('FIELD', 'CLASSIFICATION'), '🎯', 'Field Classification'),
+    ('technical', ('TECHNICAL', 'ELEMENTS'), '🔧', 'Technical Elements'),
+    ('debate', ('DEBATE', 'SEED'), '⚔️', 'Debate Points'),
+)
+# Header keyword -> index into _SECTION_HEADERS (lower index wins on ties)
+_HEADER_MAP = {
+    keyword: index
+    for index, (_, keywords, _, _) in enumerate(_SECTION_HEADERS)
+    for keyword in keywords
+}
+_HEADER_KEYWORD_RE = re.compile('|'.join(_HEADER_MAP))
+_SECTION_HEADER_RE = re.compile(
+    r'^[^\n]*(?:' + _HEADER_KEYWORD_RE.pattern + r')[^\n]*$',
+    re.MULTILINE | re.IGNORECASE
+)
+# Either a "key: value" line or a bullet line of 20+ characters
+_SECTION_ENTRY_RE = re.compile(
+    r'^[ \t]*(?:(?P<key>[^:\n]*):(?P<value>[^\n]*)|(?P<bullet>[-•*][^\n]{20,}))$',
+    re.MULTILINE
+)
+
+
+def classify_section_header(line_upper: str):
+    """(section, icon, label) for a header line"""
+    index = min(_HEADER_MAP[keyword] for keyword in _HEADER_KEYWORD_RE.findall(line_upper))
+    section, _, icon, label = _SECTION_HEADERS[index]
+    return section, icon, label
+
+
+# Separators printed around every prompt, response and debug step, built once
+_SEP80 = '─' * 80
+_SEP100 = '=' * 100
+
+# Whitespace-separated tokens, counted without building a list of words
+_WORD_RE = re.compile(r'\S+')
 
+# Punctuation/whitespace allowed between a section keyword and its content
+_WS_SKIP = re.compile(r'[ :\n\t]*')
 
-class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
-    """Debug version that shows all prompts and responses"""
+
+def find_keyword_offsets(text_lower: str, scanner=_SECTION_SCANNER):
+    """Single pass over the text, returning sorted hit offsets per keyword"""
+    # Scans the str directly: ASCII text is already stored one byte per char, so
+    # an encoded bytes copy would search no faster and breaks offsets otherwise
+    pattern, prefixes = scanner
+    hits = {kw: [] for kw in prefixes}
+    for match in pattern.finditer(text_lower):
+        for kw in prefixes[match.group(1)]:
+            hits[kw].append(match.start())
+    return hits
+
+
+def merge_offsets(hits, keywords):
+    """One sorted offset list covering every keyword in the group"""
+    return list(heapq.merge(*(hits[kw] for kw in keywords)))
+
+
+def first_offset_from(offsets, start: int) -> int:
+    """First offset >= start in a sorted offset list, or -1 (like str.find)"""
+    i = bisect.bisect_left(offsets, start)
+    return offsets[i] if i < len(offsets) else -1
+
+
+class DebugAnalyzerMixin:
+    """Debug behaviour layered over EnhancedPaperAnalyzer (see _make_debug_analyzer)"""
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.debug_step = 0
+        # A cached Stage 1 result would skip the very exchange this test shows
+        self.use_disk_cache = False
+        self._lower_cache = (None, None)
+        # Per-line parsing trace; set DEBUG_VERBOSE=0 to keep only the summaries
+        self.verbose = os.environ.get('DEBUG_VERBOSE', '1') == '1'
+        # Interactive pauses; DEBUG_NOPAUSE=1 (or --no-pause) skips them for batch runs
+        self._pause = (lambda msg='': '') if os.environ.get('DEBUG_NOPAUSE') else input
+    
+    def _lowercase(self, text: str) -> str:
+        """Lowercased copy of text, reused while the same text object comes back"""
+        if self._lower_cache[0] is not text:
+            self._lower_cache = (text, text.lower())
+        return self._lower_cache[1]
     
     def debug_step_separator(self, title: str):
         """Visual separator for debug steps"""
         self.debug_step += 1
-        print(f"\n{'='*100}")
+        print(f"\n{_SEP100}")
         print(f"🔍 DEBUG STEP {self.debug_step}: {title}")
-        print(f"{'='*100}")
+        print(_SEP100)
     
-    def _call_ollama(self, prompt: str, max_length: int = 2000) -> str:
-        """Debug version that shows full prompt and response"""
+    def _stream_tokens(self, prompt: str, max_length: int):
+        """Debug version that shows the full prompt and echoes the response as it streams
+        
+        Every model call goes through this hook: Stage 1's streamed analysis
+        as well as plain _call_ollama requests.
+        """
         
         self.debug_step_separator("OLLAMA API CALL")
         
         print(f"📤 PROMPT BEING SENT TO AI:")
-        print(f"{'─'*80}")
+        print(_SEP80)
         print(prompt)
-        print(f"{'─'*80}")
+        print(_SEP80)
         print(f"📊 Prompt length: {len(prompt)} characters")
         print(f"📊 Max response length: {max_length}")
         
         print(f"\n⏳ Sending to Ollama... (this may take 30-60 seconds)")
         start_time = time.time()
         
-        # Call parent method
-        response = super()._call_ollama(prompt, max_length)
-        
-        elapsed_time = time.time() - start_time
-        
-        print(f"\n📥 AI RESPONSE RECEIVED:")
-        print(f"{'─'*80}")
-        print(response)
-        print(f"{'─'*80}")
-        print(f"📊 Response length: {len(response)} characters")
-        print(f"⏱️ Response time: {elapsed_time:.1f} seconds")
-        
-        if "Error" in response:
-            print(f"❌ ERROR DETECTED IN RESPONSE!")
-        else:
-            print(f"✅ Response received successfully")
-        
-        input(f"\n⏸️  PRESS ENTER to continue to next step...")
-        
-        return response
+        # Stream the response so it shows up while the model is still generating
+        print(f"\n📥 AI RESPONSE (streaming):")
+        print(_SEP80)
+        response_length = 0
+        outcome = "✅ Response received successfully"
+        
+        try:
+            for token in super()._stream_tokens(prompt, max_length):
+                sys.stdout.write(token)
+                sys.stdout.flush()
+                response_length += len(token)
+                yield token
+        except GeneratorExit:
+            # The caller hung up early (Stage 1 stops once the closing remarks are clear)
+            outcome = "✂️ Stopped at the closing remarks"
+            raise
+        except Exception as e:
+            outcome = f"❌ ERROR DETECTED IN RESPONSE! {type(e).__name__}: {e}"
+            raise
+        finally:
+            print()
+            print(_SEP80)
+            
+            elapsed_time = time.time() - start_time
+            
+            print(f"📊 Response length: {response_length} characters")
+            print(f"⏱️ Response time: {elapsed_time:.1f} seconds")
+            print(outcome)
+            
+            self._pause(f"\n⏸️  PRESS ENTER to continue to next step...")
+    
+    def _call_ollama(self, prompt: str, max_length: int = 2000) -> str:
+        """Debug version that shows full prompt and response"""
+        try:
+            return "".join(self._stream_tokens(prompt, max_length)).strip()
+        except Exception as e:
+            return f"[Analysis Error: {str(e)}]"
     
     def debug_enhanced_section_detection(self, text: str):
         """Debug version of section detection"""
@@ -90,7 +222,10 @@ class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
         
         # Call parent method but intercept each section found
         sections = {}
-        text_lower = text.lower()
+        text_lower = self._lowercase(text)
+        
+        # One sweep finds every keyword; the branches below only look up offsets
+        hits = find_keyword_offsets(text_lower)
         
         # Manual section detection with debug output
         section_searches = {
@@ -108,10 +243,10 @@ class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
                 print(f"   Method: Looking for title before authors/institutions")
                 
                 # Look for author pattern
-                author_match = re.search(r'([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+|Computer Science Department|University)', text[:1000])
+                author_match = _AUTHOR_RE.search(text, 0, 1000)
                 if author_match:
                     potential_title = text[:author_match.start()].strip()
-                    potential_title = re.sub(r'[*†‡]', '', potential_title).strip()
+                    potential_title = potential_title.translate(_STRIP_FOOTNOTE_MARKS).strip()
                     if 20 <= len(potential_title) <= 200:
                         sections[section_name] = potential_title
                         print(f"   ✅ FOUND: {potential_title}")
@@ -123,22 +258,18 @@ class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
             
             elif section_name == 'abstract':
                 print(f"   Method: Looking for 'abstract' keyword + content")
-                abstract_pos = text_lower.find('abstract')
+                abstract_pos = first_offset_from(hits['abstract'], 0)
                 if abstract_pos >= 0:
                     print(f"   📍 Found 'abstract' at position {abstract_pos}")
                     
                     # Extract content after 'abstract'
-                    start = abstract_pos + len('abstract')
-                    while start < len(text) and text[start] in ' :\n\t':
-                        start += 1
+                    start = _WS_SKIP.match(text, abstract_pos + len('abstract')).end()
                     
-                    # Find end
-                    end_keywords = ['introduction', 'keywords', '1.', 'method']
-                    end = len(text)
-                    for keyword in end_keywords:
-                        keyword_pos = text_lower.find(keyword, start)
-                        if keyword_pos != -1:
-                            end = min(end, keyword_pos)
+                    # Find end: earliest of any end keyword after the content start
+                    end_hits = merge_offsets(hits, ['introduction', 'keywords', '1.', 'method'])
+                    end = first_offset_from(end_hits, start)
+                    if end == -1:
+                        end = len(text)
                     
                     # Limit length
                     end = min(end, start + 2000)
@@ -161,23 +292,20 @@ class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
                 print(f"   Method: Looking for 'conclusion' keyword + content")
                 conclusion_keywords = ['conclusion', 'conclusions', 'concluding remarks']
                 
+                end_hits = merge_offsets(hits, ['references', 'acknowledgments', 'appendix'])
+                
                 found = False
                 for keyword in conclusion_keywords:
-                    keyword_pos = text_lower.find(keyword)
+                    keyword_pos = first_offset_from(hits[keyword], 0)
                     if keyword_pos >= 0:
                         print(f"   📍 Found '{keyword}' at position {keyword_pos}")
                         
-                        start = keyword_pos + len(keyword)
-                        while start < len(text) and text[start] in ' :\n\t':
-                            start += 1
+                        start = _WS_SKIP.match(text, keyword_pos + len(keyword)).end()
                         
                         # Find end
-                        end_keywords = ['references', 'acknowledgments', 'appendix']
-                        end = len(text)
-                        for end_keyword in end_keywords:
-                            end_pos = text_lower.find(end_keyword, start)
-                            if end_pos != -1:
-                                end = min(end, end_pos)
+                        end = first_offset_from(end_hits, start)
+                        if end == -1:
+                            end = len(text)
                         
                         end = min(end, start + 2000)
                         
@@ -200,7 +328,7 @@ class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
                 
                 found = False
                 for keyword in future_keywords:
-                    keyword_pos = text_lower.find(keyword)
+                    keyword_pos = first_offset_from(hits[keyword], 0)
                     if keyword_pos >= 0:
                         print(f"   📍 Found '{keyword}' at position {keyword_pos}")
                         
@@ -225,7 +353,7 @@ class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
         if not sections:
             print(f"   ❌ NO SECTIONS FOUND!")
         
-        input(f"\n⏸️  PRESS ENTER to continue...")
+        self._pause(f"\n⏸️  PRESS ENTER to continue...")
         
         return sections
     
@@ -243,7 +371,8 @@ class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
         # Show the exact prompt that will be sent
         print(f"🎯 ABOUT TO GENERATE COMPREHENSIVE ANALYSIS PROMPT...")
         
-        # Call parent method which will trigger our debug _call_ollama
+        # The parent method streams through our debug _stream_tokens hook; this
+        # analyzer opts out of the disk cache, so the model is always asked
         result = self.stage1_core_understanding_analysis(core_sections)
         
         return result
@@ -254,65 +383,45 @@ class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
         self.debug_step_separator(f"PARSING: {title}")
         
         print(f"📥 RESPONSE TO PARSE:")
-        print(f"{'─'*80}")
+        print(_SEP80)
         print(response)
-        print(f"{'─'*80}")
+        print(_SEP80)
         
         print(f"\n🔍 PARSING PROCESS:")
-        lines = response.split('\n')
-        print(f"   Total lines: {len(lines)}")
+        total_lines = response.count('\n') + 1
+        print(f"   Total lines: {total_lines}")
         
-        current_section = None
+        # One pass finds every header line; each section is the text up to the next header
+        headers = list(_SECTION_HEADER_RE.finditer(response))
         parsed_data = {}
         
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-            
-            print(f"   Line {i+1}: {line_stripped}")
-            
-            # Check for section headers
-            line_upper = line_stripped.upper()
-            if any(keyword in line_upper for keyword in ['RESEARCH STORY', 'STORY ARC']):
-                current_section = 'story'
-                print(f"      📖 DETECTED SECTION: Research Story")
-                continue
-            elif any(keyword in line_upper for keyword in ['CONFIDENCE', 'ASSESSMENT']):
-                current_section = 'confidence'
-                print(f"      🔍 DETECTED SECTION: Confidence Assessment")
-                continue
-            elif any(keyword in line_upper for keyword in ['FIELD', 'CLASSIFICATION']):
-                current_section = 'field'
-                print(f"      🎯 DETECTED SECTION: Field Classification")
-                continue
-            elif any(keyword in line_upper for keyword in ['TECHNICAL', 'ELEMENTS']):
-                current_section = 'technical'
-                print(f"      🔧 DETECTED SECTION: Technical Elements")
-                continue
-            elif any(keyword in line_upper for keyword in ['DEBATE', 'SEED']):
-                current_section = 'debate'
-                print(f"      ⚔️ DETECTED SECTION: Debate Points")
-                continue
+        for i, header in enumerate(headers):
+            header_line = header.group().strip()
+            current_section, icon, label = classify_section_header(header_line.upper())
+            print(f"   {header_line}")
+            print(f"      {icon} DETECTED SECTION: {label}")
             
-            # Parse content based on current section
-            if current_section:
-                print(f"      📝 PARSING IN SECTION: {current_section}")
+            section_end = headers[i + 1].start() if i + 1 < len(headers) else len(response)
+            for entry in _SECTION_ENTRY_RE.finditer(response, header.end(), section_end):
+                if self.verbose:
+                    print(f"   {entry.group().strip()}")
+                    print(f"      📝 PARSING IN SECTION: {current_section}")
                 
-                if ':' in line_stripped:
-                    key, value = line_stripped.split(':', 1)
-                    key_clean = key.strip('- *').lower().replace(' ', '_')
-                    value_clean = value.strip()
-                    print(f"         KEY: {key_clean}")
-                    print(f"         VALUE: {value_clean}")
+                if entry.group('key') is not None:
+                    key_clean = entry.group('key').strip().strip('- *').lower().replace(' ', '_')
+                    value_clean = entry.group('value').strip()
+                    if self.verbose:
+                        print(f"         KEY: {key_clean}")
+                        print(f"         VALUE: {value_clean}")
                     
                     if current_section not in parsed_data:
                         parsed_data[current_section] = {}
                     parsed_data[current_section][key_clean] = value_clean
                 
-                elif line_stripped.startswith(('-', '•', '*')) and len(line_stripped) > 20:
-                    point = line_stripped.strip('- •*').strip()
-                    print(f"         BULLET POINT: {point}")
+                else:
+                    point = entry.group('bullet').strip().strip('- •*').strip()
+                    if self.verbose:
+                        print(f"         BULLET POINT: {point}")
                     
                     if current_section not in parsed_data:
                         parsed_data[current_section] = []
@@ -320,28 +429,41 @@ class DebugEnhancedAnalyzer(EnhancedPaperAnalyzer):
                         parsed_data[current_section] = []
                     parsed_data[current_section].append(point)
         
-        print(f"\n📊 PARSING RESULTS:")
+        # Build the results dump and write it in one go
+        report = [f"\n📊 PARSING RESULTS:"]
         for section, content in parsed_data.items():
             if isinstance(content, dict):
-                print(f"   {section.upper()}: {len(content)} key-value pairs")
+                report.append(f"   {section.upper()}: {len(content)} key-value pairs")
                 for key, value in content.items():
-                    print(f"      {key}: {value[:60]}{'...' if len(value) > 60 else ''}")
+                    report.append(f"      {key}: {value[:60]}{'...' if len(value) > 60 else ''}")
             elif isinstance(content, list):
-                print(f"   {section.upper()}: {len(content)} items")
+                report.append(f"   {section.upper()}: {len(content)} items")
                 for item in content:
-                    print(f"      • {item[:60]}{'...' if len(item) > 60 else ''}")
+                    report.append(f"      • {item[:60]}{'...' if len(item) > 60 else ''}")
+        sys.stdout.write('\n'.join(report) + '\n')
         
-        input(f"\n⏸️  PRESS ENTER to continue...")
+        self._pause(f"\n⏸️  PRESS ENTER to continue...")
         
         return parsed_data
 
 
+@lru_cache(maxsize=None)
+def _make_debug_analyzer():
+    """Import the analyzer stack and build the debug subclass on first use"""
+    from enhanced_analyzer import EnhancedPaperAnalyzer
+    
+    class DebugEnhancedAnalyzer(DebugAnalyzerMixin, EnhancedPaperAnalyzer):
+        """Debug version that shows all prompts and responses"""
+    
+    return DebugEnhancedAnalyzer
+
+
 def test_full_transparency_debug(pdf_path: str):
     """Test with complete transparency and debug output"""
     
     print("🔍 FULL TRANSPARENCY DEBUG TEST")
     print("See exactly what we ask the AI and what it responds")
-    print("=" * 100)
+    print(_SEP100)
     
     pdf_file = Path(pdf_path)
     if not pdf_file.exists():
@@ -351,7 +473,14 @@ def test_full_transparency_debug(pdf_path: str):
     print(f"📄 Paper: {pdf_file.name}")
     print(f"📍 Path: {pdf_path}")
     
-    # Initialize debug processors
+    # Import and initialize debug processors
+    try:
+        from pdf_processor import PDFProcessor
+        DebugEnhancedAnalyzer = _make_debug_analyzer()
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        return False
+    
     pdf_processor = PDFProcessor()
     debug_analyzer = DebugEnhancedAnalyzer()
     
@@ -372,21 +501,22 @@ def test_full_transparency_debug(pdf_path: str):
         
         print(f"✅ Extraction complete:")
         print(f"   📊 Total characters: {len(raw_text):,}")
-        print(f"   📊 Total words (approx): {len(raw_text.split()):,}")
+        word_count = sum(1 for _ in _WORD_RE.finditer(raw_text))
+        print(f"   📊 Total words (approx): {word_count:,}")
         print(f"   📊 PDF sections found: {list(paper_data['sections'].keys())}")
         print(f"   📊 Processing chunks: {paper_data['metadata']['num_chunks']}")
         
         print(f"\n📄 FULL TEXT PREVIEW (First 500 characters):")
-        print(f"{'─'*80}")
+        print(_SEP80)
         print(raw_text[:500])
-        print(f"{'─'*80}")
+        print(_SEP80)
         
         print(f"\n📄 FULL TEXT PREVIEW (Last 500 characters):")
-        print(f"{'─'*80}")
+        print(_SEP80)
         print(raw_text[-500:])
-        print(f"{'─'*80}")
+        print(_SEP80)
         
-        input(f"\n⏸️  PRESS ENTER to continue to section detection...")
+        debug_analyzer._pause(f"\n⏸️  PRESS ENTER to continue to section detection...")
         
         # ================== SECTION DETECTION DEBUG ==================
         core_sections = debug_analyzer.debug_enhanced_section_detection(raw_text)
@@ -402,7 +532,7 @@ def test_full_transparency_debug(pdf_path: str):
         debug_analyzer.debug_step_separator("FINAL RESULTS WITH SOURCES")
         
         print(f"📊 COMPLETE ANALYSIS RESULTS:")
-        print(f"{'─'*80}")
+        print(_SEP80)
         
         print(f"\n🎯 FIELD CLASSIFICATION:")
         print(f"   Result: {core_understanding.field_classification}")
@@ -437,11 +567,12 @@ def test_full_transparency_debug(pdf_path: str):
         # Show what drove this classification
         if core_sections.get('abstract'):
             abstract_keywords = core_sections['abstract'].lower()
-            ml_keywords = ['machine learning', 'neural', 'deep learning', 'algorithm', 'model']
-            network_keywords = ['network', 'graph', 'node', 'edge', 'community']
             
-            ml_count = sum(1 for kw in ml_keywords if kw in abstract_keywords)
-            network_count = sum(1 for kw in network_keywords if kw in abstract_keywords)
+            # Distinct keywords present per category, from a single scan
+            keyword_hits = find_keyword_offsets(abstract_keywords, _FIELD_KEYWORD_SCANNER)
+            category_counts = Counter(FIELD_KEYWORD_CATEGORIES[kw] for kw, offsets in keyword_hits.items() if offsets)
+            ml_count = category_counts['ml']
+            network_count = category_counts['network']
             
             print(f"   ML keywords found in abstract: {ml_count}")
             print(f"   Network keywords found in abstract: {network_count}")
@@ -458,7 +589,7 @@ def test_full_transparency_debug(pdf_path: str):
             print(f"   ❌ NO DEBATE POINTS GENERATED - This is a problem!")
         
         print(f"\n📝 RECOMMENDATIONS FOR IMPROVEMENT:")
-        if core_understanding.field_classification != "General Research" and "not relevant" in input("Is the field classification relevant to your paper? (yes/no): ").lower():
+        if core_understanding.field_classification != "General Research" and "not relevant" in debug_analyzer._pause("Is the field classification relevant to your paper? (yes/no): ").lower():
             print(f"   🔧 Field classification is wrong - need to improve prompts")
         
         if len(core_understanding.debate_seed_points) < 5:
@@ -486,8 +617,14 @@ def main():
     # Default paper path
     default_path = "/home/md724/ai_paper_narrator/data/input/WCC_and_CM_Paper_Complex_Networks-1.pdf"
     
-    if len(sys.argv) > 1:
-        pdf_path = sys.argv[1]
+    args = sys.argv[1:]
+    if '--no-pause' in args:
+        args.remove('--no-pause')
+        os.environ['DEBUG_NOPAUSE'] = '1'
+    no_pause = bool(os.environ.get('DEBUG_NOPAUSE'))
+    
+    if args:
+        pdf_path = args[0]
     else:
         pdf_path = default_path
     
@@ -497,9 +634,9 @@ def main():
     print(f"   • Complete AI responses")
     print(f"   • Step-by-step parsing")
     print(f"   • Source of every piece of information")
-    print(f"   • Interactive pauses for review")
+    print(f"   • Interactive pauses for review" + (" (disabled: no-pause mode)" if no_pause else ""))
     
-    confirm = input(f"\n❓ Ready to start comprehensive debug? (y/N): ").strip().lower()
+    confirm = 'y' if no_pause else input(f"\n❓ Ready to start comprehensive debug? (y/N): ").strip().lower()
     if confirm not in ['y', 'yes']:
         print("Debug cancelled.")
         return
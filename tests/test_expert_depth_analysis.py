@@ -15,12 +15,19 @@ from pathlib import Path
 sys.path.append('src')
 sys.path.append('.')
 
+# Let Stage 2 fan out its prompts
+os.environ.setdefault("OLLAMA_NUM_PARALLEL", "8")
+
 # Import components
 try:
     from pdf_processor import PDFProcessor
     from enhanced_analyzer import EnhancedPaperAnalyzer
     from enhanced_stage2_expert import EnhancedStage2Expert
     from expert_deep_prompts import ExpertDeepPrompts
+    from ollama_http import prewarm
+    from quality_score import compute_quality, QUALITY_MAX_SCORE
+    import pipeline_cache
+    import analyzers_registry
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("Make sure you have all files:")
@@ -47,16 +54,21 @@ def test_expert_depth_comparison(pdf_path: str):
     
     # Initialize processors
     pdf_processor = PDFProcessor()
-    stage1_analyzer = EnhancedPaperAnalyzer()
-    expert_stage2 = EnhancedStage2Expert()
+    stage1_analyzer = analyzers_registry.get(EnhancedPaperAnalyzer)
+    expert_stage2 = analyzers_registry.get(EnhancedStage2Expert)
     
     # Test connections
-    if not stage1_analyzer.test_connection() or not expert_stage2.test_connection():
+    if not analyzers_registry.check_connection(stage1_analyzer) or not analyzers_registry.check_connection(expert_stage2):
         print("❌ Ollama connection failed")
         return False
     
     print("✅ All connections successful")
     
+    # Pin every model the two stages use before anything is timed
+    for model_name in {stage1_analyzer.model_name, expert_stage2.model_name}:
+        if not prewarm(model_name, stage1_analyzer.base_url):
+            print(f"⚠️ Could not pre-warm {model_name}; first call will pay the load time")
+    
     try:
         # ================== PAPER EXTRACTION ==================
         print(f"\n📖 EXTRACTING PAPER CONTENT...")
@@ -116,12 +128,12 @@ def test_expert_depth_comparison(pdf_path: str):
         print(f"\n🔬 EXPERT EVIDENCE ANALYSIS ({len(expert_evidence)} claims):")
         
         for i, evidence in enumerate(expert_evidence, 1):
-            print(f"\n   {i}. CLAIM: {evidence.claim[:70]}...")
+            print(f"\n   {i}. CLAIM: {evidence.claim:.70}...")
             
-            print(f"      🧮 STATISTICIAN: {evidence.statistician_analysis[:80]}...")
-            print(f"      📐 METHODOLOGIST: {evidence.methodologist_analysis[:80]}...")  
-            print(f"      🎯 DOMAIN EXPERT: {evidence.domain_expert_analysis[:80]}...")
-            print(f"      🔄 REPLICATION EXPERT: {evidence.replication_expert_analysis[:80]}...")
+            print(f"      🧮 STATISTICIAN: {evidence.statistician_analysis:.80}...")
+            print(f"      📐 METHODOLOGIST: {evidence.methodologist_analysis:.80}...")  
+            print(f"      🎯 DOMAIN EXPERT: {evidence.domain_expert_analysis:.80}...")
+            print(f"      🔄 REPLICATION EXPERT: {evidence.replication_expert_analysis:.80}...")
             
             print(f"      📊 EVIDENCE STRENGTHS:")
             for aspect, strength in evidence.evidence_strength_detailed.items():
@@ -131,12 +143,12 @@ def test_expert_depth_comparison(pdf_path: str):
             if evidence.specific_debate_points.get('optimist'):
                 print(f"      😊 OPTIMIST AMMUNITION:")
                 for point in evidence.specific_debate_points['optimist'][:2]:
-                    print(f"         + {point[:60]}...")
+                    print(f"         + {point:.60}...")
             
             if evidence.specific_debate_points.get('skeptic'):
                 print(f"      🤨 SKEPTIC AMMUNITION:")
                 for point in evidence.specific_debate_points['skeptic'][:2]:
-                    print(f"         - {point[:60]}...")
+                    print(f"         - {point:.60}...")
         
         # ================== FIELD CONTROVERSIES ==================
         print(f"\n⚔️ FIELD-SPECIFIC CONTROVERSIES:")
@@ -145,22 +157,22 @@ def test_expert_depth_comparison(pdf_path: str):
         if controversies.methodological_controversies:
             print(f"\n   📐 METHODOLOGICAL BATTLES ({len(controversies.methodological_controversies)}):")
             for i, controversy in enumerate(controversies.methodological_controversies[:3], 1):
-                print(f"      {i}. {controversy[:70]}...")
+                print(f"      {i}. {controversy:.70}...")
         
         if controversies.statistical_controversies:
             print(f"\n   📊 STATISTICAL DISPUTES ({len(controversies.statistical_controversies)}):")
             for i, controversy in enumerate(controversies.statistical_controversies[:3], 1):
-                print(f"      {i}. {controversy[:70]}...")
+                print(f"      {i}. {controversy:.70}...")
         
         if controversies.domain_technical_disputes:
             print(f"\n   🎯 DOMAIN-SPECIFIC FIGHTS ({len(controversies.domain_technical_disputes)}):")
             for i, dispute in enumerate(controversies.domain_technical_disputes[:3], 1):
-                print(f"      {i}. {dispute[:70]}...")
+                print(f"      {i}. {dispute:.70}...")
         
         if controversies.generalizability_wars:
             print(f"\n   🌍 GENERALIZABILITY WARS ({len(controversies.generalizability_wars)}):")
             for i, war in enumerate(controversies.generalizability_wars[:3], 1):
-                print(f"      {i}. {war[:70]}...")
+                print(f"      {i}. {war:.70}...")
         
         # ================== TECHNICAL DEEP DIVE ==================
         print(f"\n🔬 TECHNICAL DEEP DIVE:")
@@ -177,12 +189,12 @@ def test_expert_depth_comparison(pdf_path: str):
         if deep_dive.algorithmic_specifications:
             print(f"\n   🧮 SAMPLE ALGORITHMIC DETAILS:")
             for i, spec in enumerate(deep_dive.algorithmic_specifications[:2], 1):
-                print(f"      {i}. {spec[:80]}...")
+                print(f"      {i}. {spec:.80}...")
         
         if deep_dive.numerical_precision:
             print(f"\n   📊 SAMPLE NUMERICAL PRECISION:")
             for i, num in enumerate(deep_dive.numerical_precision[:2], 1):
-                print(f"      {i}. {num[:80]}...")
+                print(f"      {i}. {num:.80}...")
         
         # ================== EXPERT DEBATE SCENARIOS ==================
         print(f"\n🎭 EXPERT DEBATE SCENARIOS ({len(comprehensive_expert_analysis.expert_debate_scenarios)}):")
@@ -190,28 +202,17 @@ def test_expert_depth_comparison(pdf_path: str):
         for i, scenario in enumerate(comprehensive_expert_analysis.expert_debate_scenarios, 1):
             print(f"\n   {i}. {scenario['title']}")
             print(f"      🔥 Core Disagreement: {scenario['core_disagreement']}")
-            print(f"      😊 Position A: {scenario.get('optimist_position', scenario.get('statistician_position', 'N/A'))[:60]}...")
-            print(f"      🤨 Position B: {scenario.get('skeptic_position', scenario.get('domain_expert_position', 'N/A'))[:60]}...")
+            print(f"      😊 Position A: {scenario.get('optimist_position', scenario.get('statistician_position', 'N/A')):.60}...")
+            print(f"      🤨 Position B: {scenario.get('skeptic_position', scenario.get('domain_expert_position', 'N/A')):.60}...")
             
             if scenario.get('technical_details'):
                 print(f"      🔬 Technical Evidence:")
                 for detail in scenario['technical_details'][:2]:
-                    print(f"         • {detail[:60]}...")
+                    print(f"         • {detail:.60}...")
         
         # ================== QUALITY ASSESSMENT ==================
         print(f"\n{'='*20} EXPERT ANALYSIS QUALITY ASSESSMENT {'='*20}")
         
-        quality_score = 0
-        max_score = 25  # Increased for expert analysis
-        
-        # Multi-expert evidence depth
-        if len(expert_evidence) >= 2:
-            quality_score += 5
-            print("   ✅ Multiple expert evidence analyses (+5)")
-        elif len(expert_evidence) >= 1:
-            quality_score += 3
-            print("   ✅ Basic expert evidence analysis (+3)")
-        
         # Field-specific controversy depth
         controversy_count = sum([
             len(controversies.methodological_controversies),
@@ -220,13 +221,6 @@ def test_expert_depth_comparison(pdf_path: str):
             len(controversies.generalizability_wars)
         ])
         
-        if controversy_count >= 8:
-            quality_score += 5
-            print("   ✅ Comprehensive field controversies identified (+5)")
-        elif controversy_count >= 4:
-            quality_score += 3
-            print("   ✅ Good field controversy coverage (+3)")
-        
         # Technical precision depth
         technical_count = sum([
             len(deep_dive.algorithmic_specifications),
@@ -235,37 +229,22 @@ def test_expert_depth_comparison(pdf_path: str):
             len(deep_dive.methodological_choices)
         ])
         
-        if technical_count >= 10:
-            quality_score += 5
-            print("   ✅ Maximum technical granularity achieved (+5)")
-        elif technical_count >= 5:
-            quality_score += 3
-            print("   ✅ Good technical detail extraction (+3)")
-        
-        # Expert perspective sophistication
-        if expert_evidence:
-            expert_perspectives = sum(1 for ev in expert_evidence if ev.statistician_analysis and ev.domain_expert_analysis)
-            if expert_perspectives >= 2:
-                quality_score += 4
-                print("   ✅ Multi-expert perspective analysis (+4)")
-            elif expert_perspectives >= 1:
-                quality_score += 2
-                print("   ✅ Basic expert perspective analysis (+2)")
-        
-        # Debate scenario sophistication
-        if len(comprehensive_expert_analysis.expert_debate_scenarios) >= 3:
-            quality_score += 3
-            print("   ✅ Multiple expert debate scenarios (+3)")
-        elif len(comprehensive_expert_analysis.expert_debate_scenarios) >= 1:
-            quality_score += 2
-            print("   ✅ Basic debate scenarios (+2)")
-        
-        # Evidence strength granularity
-        if expert_evidence:
-            detailed_strength = sum(1 for ev in expert_evidence if len(ev.evidence_strength_detailed) >= 3)
-            if detailed_strength >= 1:
-                quality_score += 3
-                print("   ✅ Detailed evidence strength assessment (+3)")
+        # Expert perspective sophistication and evidence strength granularity
+        expert_perspectives = sum(1 for ev in expert_evidence if ev.statistician_analysis and ev.domain_expert_analysis)
+        detailed_strength = sum(1 for ev in expert_evidence if len(ev.evidence_strength_detailed) >= 3)
+        
+        quality_score, awarded = compute_quality([
+            len(expert_evidence),
+            controversy_count,
+            technical_count,
+            expert_perspectives,
+            len(comprehensive_expert_analysis.expert_debate_scenarios),
+            detailed_strength
+        ])
+        max_score = QUALITY_MAX_SCORE  # Increased for expert analysis
+        
+        for points, label in awarded:
+            print(f"   ✅ {label} (+{points})")
         
         print(f"\n🏆 EXPERT ANALYSIS QUALITY SCORE: {quality_score}/{max_score}")
         
@@ -293,11 +272,11 @@ def test_expert_depth_comparison(pdf_path: str):
         
         if controversies.statistical_controversies:
             print(f"   OLD: 'Statistical methods could be improved'")
-            print(f"   NEW: '{controversies.statistical_controversies[0][:80]}...'")
+            print(f"   NEW: '{controversies.statistical_controversies[0]:.80}...'")
         
         if deep_dive.numerical_precision:
             print(f"   OLD: 'Performance was good'")  
-            print(f"   NEW: '{deep_dive.numerical_precision[0][:80]}...'")
+            print(f"   NEW: '{deep_dive.numerical_precision[0]:.80}...'")
         
         return quality_score >= 15
         
@@ -315,6 +294,11 @@ def main():
     print("Testing Maximum Debate Depth Enhancement")
     print("-" * 80)
     
+    if "--no-cache" in sys.argv:
+        sys.argv.remove("--no-cache")
+        pipeline_cache.disable()
+        print("💾 Pipeline cache disabled")
+    
     # Default paper path
     default_path = "/home/md724/ai_paper_narrator/data/input/WCC_and_CM_Paper_Complex_Networks-1.pdf"
     
@@ -15,8 +15,10 @@ sys.path.append('src')
 sys.path.append('.')
 
 try:
-    from humanized_dialogue_pipeline import HumanizedEnhancedPipeline, HumanizedDialogueRefiner
+    from humanized_dialogue_pipeline import HumanizedDialogueRefiner
     from integrated_enhanced_pipeline import IntegratedEnhancedPipeline
+    import pipeline_cache
+    import analyzers_registry
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("Make sure you have:")
@@ -31,7 +33,7 @@ def test_text_cleanup_examples():
     print("🧹 TEXT CLEANUP EXAMPLES")
     print("=" * 60)
     
-    refiner = HumanizedDialogueRefiner()
+    refiner = analyzers_registry.get(HumanizedDialogueRefiner)
     
     # Test field cleanup
     print("🎯 FIELD CLASSIFICATION CLEANUP:")
@@ -61,6 +63,16 @@ def test_text_cleanup_examples():
         print(f"  Before: {ammo}")
         print(f"  After:  {cleaned}")
         print()
+        assert cleaned == ammo.split(": ", 1)[1], f"Label not removed: {ammo}"
+    
+    # Labels are stripped line by line; a label never swallows the line above it
+    multi_line = "The Baselines Look Weak\nWEAK EVIDENCE: no ablation"
+    cleaned = refiner.remove_category_labels(multi_line)
+    assert cleaned == "The Baselines Look Weak\nno ablation", f"Lines merged or lost: {cleaned!r}"
+    
+    # Only category labels go; speaker names and ordinary sentences stay
+    for line in ["Marcus Webb: I think the baselines are weak.", "However I Disagree: the gains are real."]:
+        assert refiner.remove_category_labels(line) == line, f"Non-label prefix stripped: {line}"
 
 
 def test_voice_assignments():
@@ -69,7 +81,7 @@ def test_voice_assignments():
     print("🎤 VOICE ASSIGNMENT CORRECTIONS")
     print("=" * 60)
     
-    refiner = HumanizedDialogueRefiner()
+    refiner = analyzers_registry.get(HumanizedDialogueRefiner)
     
     test_speakers = [
         "Host",
@@ -84,6 +96,9 @@ def test_voice_assignments():
     for speaker in test_speakers:
         profile = refiner.get_voice_profile(speaker)
         print(f"  {speaker:20} → {profile.voice_id} ({profile.gender} - {profile.description})")
+    
+    # Repeat lookups must hand back the same shared (frozen) profile
+    assert refiner.get_voice_profile("Dr. Ava D.") is refiner.get_voice_profile("Dr. Ava D.")
 
 
 def test_humanization_examples():
@@ -92,7 +107,7 @@ def test_humanization_examples():
     print("\n🎭 HUMANIZATION EXAMPLES")
     print("=" * 60)
     
-    refiner = HumanizedDialogueRefiner()
+    refiner = analyzers_registry.get(HumanizedDialogueRefiner)
     
     # Test introduction cleanup
     print("🎬 INTRODUCTION HUMANIZATION:")
@@ -165,7 +180,8 @@ def compare_full_pipeline_outputs(pdf_path: str):
     print("\n🔄 FULL PIPELINE COMPARISON")
     print("=" * 60)
     
-    # Test original pipeline
+    # The humanized pipeline is the original one plus a refinement pass, so
+    # run PDF → Stage 1 → Stage 2 → script once and humanize that script
     print("🤖 RUNNING ORIGINAL PIPELINE...")
     original_pipeline = IntegratedEnhancedPipeline()
     
@@ -173,14 +189,6 @@ def compare_full_pipeline_outputs(pdf_path: str):
         print("❌ Prerequisites not met for original pipeline")
         return
     
-    # Test humanized pipeline  
-    print("🎭 RUNNING HUMANIZED PIPELINE...")
-    humanized_pipeline = HumanizedEnhancedPipeline()
-    
-    if not humanized_pipeline.check_prerequisites():
-        print("❌ Prerequisites not met for humanized pipeline")
-        return
-    
     try:
         # Just test the first few steps to compare outputs
         paper_data = original_pipeline.pdf_processor.process_paper(pdf_path)
@@ -195,8 +203,9 @@ def compare_full_pipeline_outputs(pdf_path: str):
             stage1, stage2, max_exchanges=2
         )
         
-        # Generate humanized conversation
-        refiner = HumanizedDialogueRefiner() 
+        # Generate humanized conversation from the same script
+        print("🎭 HUMANIZING ORIGINAL SCRIPT...")
+        refiner = analyzers_registry.get(HumanizedDialogueRefiner) 
         humanized_script = refiner.refine_conversation_script(original_script, stage1.research_field)
         
         # Compare results
@@ -232,6 +241,11 @@ def main():
     print("Compare before/after dialogue refinement")
     print("=" * 80)
     
+    if "--no-cache" in sys.argv:
+        sys.argv.remove("--no-cache")
+        pipeline_cache.disable()
+        print("💾 Pipeline cache disabled")
+    
     # Run individual tests
     test_text_cleanup_examples()
     test_voice_assignments()
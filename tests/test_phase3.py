@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """Test Phase 3 audio generation"""
-import sys, os
+import sys, os, time
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 def test_audio_system():
@@ -29,6 +29,24 @@ def test_audio_system():
         print(f"   File: {segment.audio_file}")
         print(f"   Duration: {segment.duration:.1f}s")
         
+        # Test batched generation with a short mock script
+        mock_turns = [
+            ("Welcome to Research Rundown!", "Narrator", "intro"),
+            ("This approach scales to ten million nodes.", "Dr. Ava D.", "conversation"),
+            ("But the baselines were never tuned.", "Prof. Marcus Webb", "conversation"),
+            ("The ablation still shows a clear gain.", "Dr. Ava D.", "conversation"),
+            ("Thanks for watching!", "Narrator", "conclusion"),
+        ]
+        batch_start = time.time()
+        batch = generator.generate_audio_batch(mock_turns)
+        batch_time = time.time() - batch_start
+        
+        if [seg.speaker for seg in batch] != [speaker for _, speaker, _ in mock_turns]:
+            print("❌ Batched segments came back out of order")
+            return False
+        
+        print(f"✅ Batch audio generated: {len(batch)} segments in {batch_time:.1f}s")
+        
         return True
         
     except Exception as e:
@@ -3,6 +3,10 @@
 
 import sys
 import os
+import re
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src directory to path
@@ -13,12 +17,40 @@ sys.path.append('.')
 try:
     from pdf_processor import PDFProcessor
     from enhanced_analyzer import EnhancedPaperAnalyzer
+    from ollama_http import prewarm
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("Make sure you're running from the project root directory")
     sys.exit(1)
 
 
+# Manual-fallback markers, found in one pass over the paper ("conclusions"
+# starts with "conclusion", so it needs no separate alternative). Matching
+# case-insensitively on the original text avoids a lowercased copy of the
+# paper, and keeps offsets valid where lower() would change string length.
+_FALLBACK_KEYWORD_RE = re.compile(r'abstract|conclusion|concluding remarks|references', re.IGNORECASE)
+
+# How far past its marker a manual section may run before the search gives up
+ABSTRACT_SEARCH_WINDOW = 20000
+CONCLUSION_SEARCH_WINDOW = 15000
+
+# Academic vocabulary for the per-point sophistication count; the quality
+# bonus looks for the first six. Substring matches, like the original
+# `word in text.lower()` checks.
+SOPHISTICATION_RE = re.compile(
+    r'methodology|statistical|reproducibility|generalizability|validation|evidence|baseline|control', re.IGNORECASE
+)
+SOPHISTICATION_TERMS = 8
+SOPHISTICATED_LANGUAGE_TERMS = frozenset(
+    ['methodology', 'statistical', 'reproducibility', 'generalizability', 'evidence', 'validation']
+)
+
+# TEST_VERBOSE=0 skips building the long section/point listings and failure
+# tracebacks (e.g. in CI, where output goes nowhere); scores, summaries and
+# one-line errors always print
+VERBOSE = os.environ.get('TEST_VERBOSE', '1') == '1'
+
+
 def test_real_paper_analysis(pdf_path: str):
     """Test Stage 1 analysis with a real PDF paper"""
     
@@ -30,35 +62,51 @@ def test_real_paper_analysis(pdf_path: str):
         print(f"❌ PDF not found: {pdf_path}")
         return False
     
+    # Read once; the same bytes feed the extraction cache key and the parser
+    pdf_bytes = pdf_file.read_bytes()
+    
     print(f"📄 Loading PDF: {pdf_file.name}")
     
     # Initialize processors
     pdf_processor = PDFProcessor()
     analyzer = EnhancedPaperAnalyzer()
     
-    # Test connections
+    def extract_and_detect():
+        """Producer: PDF text, then its core sections (all CPU work, no Ollama)"""
+        paper_data = pdf_processor.process_paper_bytes(pdf_bytes)
+        return paper_data, analyzer.enhanced_section_detection(paper_data["raw_text"])
+    
+    # Test connections first, so a dead server fails fast instead of waiting on the parse
     if not analyzer.test_connection():
         print("❌ Ollama connection failed")
         return False
     
     print("✅ Ollama connection successful")
     
+    # Stage 1 is a single Ollama prompt over all core sections, so rather than
+    # per-section consumers the pipeline overlaps the whole parse (Steps 1-2)
+    # with the model pre-warm
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        print("\n📖 Steps 1-2: Extracting text and detecting critical sections...")
+        parsing = executor.submit(extract_and_detect)
+        
+        # Load and pin the model while the PDF is still parsing
+        if not prewarm(analyzer.model_name, analyzer.base_url):
+            print(f"⚠️ Could not pre-warm {analyzer.model_name}; first call will pay the load time")
+    
     try:
-        # Step 1: Extract text from PDF
-        print("\n📖 Step 1: Extracting text from PDF...")
-        paper_data = pdf_processor.process_paper(pdf_path)
+        paper_data, core_sections = parsing.result()
         raw_text = paper_data["raw_text"]
         
         print(f"✅ Extracted {len(raw_text):,} characters")
-        print(f"📊 Text preview: {raw_text[:200]}...")
-        
-        # Step 2: Enhanced section detection
-        print("\n🔍 Step 2: Detecting critical sections...")
-        core_sections = analyzer.enhanced_section_detection(raw_text)
+        if VERBOSE:
+            print(f"📊 Text preview: {raw_text[:200]}...")
         
         print(f"\n📋 Found sections:")
         for section, content in core_sections.items():
             print(f"   ✅ {section}: {len(content)} characters")
+            if not VERBOSE:
+                continue
             if len(content) > 100:
                 print(f"      Preview: {content[:100]}...")
             else:
@@ -69,28 +117,36 @@ def test_real_paper_analysis(pdf_path: str):
             print("🔧 Trying manual section search...")
             
             # Manual fallback - look for common patterns
-            text_lower = raw_text.lower()
+            # One sweep: first offset of each marker, plus every references offset
+            first_offsets = {}
+            reference_offsets = []
+            for match in _FALLBACK_KEYWORD_RE.finditer(raw_text):
+                keyword = match.group().lower()
+                first_offsets.setdefault(keyword, match.start())
+                if keyword == 'references':
+                    reference_offsets.append(match.start())
             
             # Try to find abstract manually
-            abstract_start = text_lower.find('abstract')
+            abstract_start = first_offsets.get('abstract', -1)
             if abstract_start > -1:
-                abstract_end = text_lower.find('\n\n', abstract_start + 100)
+                abstract_end = raw_text.find('\n\n', abstract_start + 100, abstract_start + ABSTRACT_SEARCH_WINDOW)
                 if abstract_end > -1:
                     abstract = raw_text[abstract_start:abstract_end].strip()
                     core_sections['abstract'] = abstract
                     print(f"   ✅ Manual abstract: {len(abstract)} characters")
             
             # Try to find conclusion manually
-            for conclusion_word in ['conclusion', 'conclusions', 'concluding remarks']:
-                conclusion_start = text_lower.find(conclusion_word)
-                if conclusion_start > -1:
-                    conclusion_end = text_lower.find('references', conclusion_start)
-                    if conclusion_end == -1:
-                        conclusion_end = conclusion_start + 1000  # Take next 1000 chars
-                    conclusion = raw_text[conclusion_start:conclusion_end].strip()
-                    core_sections['conclusion'] = conclusion
-                    print(f"   ✅ Manual conclusion: {len(conclusion)} characters")
-                    break
+            conclusion_start = first_offsets.get('conclusion', first_offsets.get('concluding remarks', -1))
+            if conclusion_start > -1:
+                next_reference = bisect_left(reference_offsets, conclusion_start)
+                if (next_reference < len(reference_offsets)
+                        and reference_offsets[next_reference] < conclusion_start + CONCLUSION_SEARCH_WINDOW):
+                    conclusion_end = reference_offsets[next_reference]
+                else:
+                    conclusion_end = conclusion_start + 1000  # Take next 1000 chars
+                conclusion = raw_text[conclusion_start:conclusion_end].strip()
+                core_sections['conclusion'] = conclusion
+                print(f"   ✅ Manual conclusion: {len(conclusion)} characters")
         
         if not core_sections:
             print("❌ Could not find any critical sections in the paper")
@@ -110,32 +166,41 @@ def test_real_paper_analysis(pdf_path: str):
         print(f"   {core_understanding.field_classification}")
         
         print(f"\n📖 RESEARCH STORY ARC:")
-        if core_understanding.research_story_arc:
+        if not core_understanding.research_story_arc:
+            print("   ❌ No story elements parsed")
+        elif VERBOSE:
             for key, value in core_understanding.research_story_arc.items():
                 print(f"   • {key.replace('_', ' ').title()}: {value}")
-        else:
-            print("   ❌ No story elements parsed")
         
         print(f"\n🔍 CONFIDENCE ASSESSMENT:")
-        if core_understanding.confidence_assessment:
+        if not core_understanding.confidence_assessment:
+            print("   ❌ No confidence elements parsed")
+        elif VERBOSE:
             for key, value in core_understanding.confidence_assessment.items():
                 print(f"   • {key.replace('_', ' ').title()}: {value}")
-        else:
-            print("   ❌ No confidence elements parsed")
+        
+        # One sweep over the joined points gives each point's sophistication
+        # terms, which serve both the quality bonus and the sample report below
+        debate_points = core_understanding.debate_seed_points
+        joined_points = "\n".join(debate_points)
+        point_starts = list(accumulate((len(point) + 1 for point in debate_points[:-1]), initial=0))
+        point_terms = [set() for _ in debate_points]
+        for match in SOPHISTICATION_RE.finditer(joined_points):
+            point_terms[bisect_right(point_starts, match.start()) - 1].add(match.group().lower())
         
         print(f"\n⚔️ DEBATE SEED POINTS ({len(core_understanding.debate_seed_points)}):")
-        if core_understanding.debate_seed_points:
+        if not core_understanding.debate_seed_points:
+            print("   ❌ No debate points generated")
+        elif VERBOSE:
             for i, point in enumerate(core_understanding.debate_seed_points, 1):
                 print(f"   {i}. {point}")
-        else:
-            print("   ❌ No debate points generated")
         
         print(f"\n🔧 TECHNICAL ELEMENTS ({len(core_understanding.key_technical_elements)}):")
-        if core_understanding.key_technical_elements:
+        if not core_understanding.key_technical_elements:
+            print("   ❌ No technical elements extracted")
+        elif VERBOSE:
             for i, element in enumerate(core_understanding.key_technical_elements, 1):
                 print(f"   {i}. {element}")
-        else:
-            print("   ❌ No technical elements extracted")
         
         # Quality assessment - Updated for comprehensive analysis
         print(f"\n📈 COMPREHENSIVE QUALITY ASSESSMENT:")
@@ -179,8 +244,7 @@ def test_real_paper_analysis(pdf_path: str):
             print("   ✅ Basic confidence assessment (+1)")
         
         # Bonus points for sophisticated content
-        sophisticated_keywords = ['methodology', 'statistical', 'reproducibility', 'generalizability', 'evidence', 'validation']
-        if any(keyword in str(core_understanding.debate_seed_points).lower() for keyword in sophisticated_keywords):
+        if any(terms & SOPHISTICATED_LANGUAGE_TERMS for terms in point_terms):
             quality_score += 1
             print("   ✅ Sophisticated academic language (+1)")
         
@@ -203,12 +267,13 @@ def test_real_paper_analysis(pdf_path: str):
         print(f"   🔧 Technical Elements: {len(core_understanding.key_technical_elements)}/8+ (target: algorithms, metrics, datasets, design, statistics, validation, baselines, complexity)")
         
         # Show sample content quality
-        if core_understanding.debate_seed_points:
+        if VERBOSE and core_understanding.debate_seed_points:
             print(f"\n🎯 SAMPLE DEBATE POINTS QUALITY:")
             for i, point in enumerate(core_understanding.debate_seed_points[:3], 1):
                 point_length = len(point)
-                sophistication = sum(1 for word in ['methodology', 'statistical', 'reproducibility', 'generalizability', 'validation', 'evidence', 'baseline', 'control'] if word in point.lower())
-                print(f"   {i}. Length: {point_length} chars, Sophistication: {sophistication}/8")
+                # Distinct terms present, not total occurrences
+                sophistication = len(point_terms[i - 1])
+                print(f"   {i}. Length: {point_length} chars, Sophistication: {sophistication}/{SOPHISTICATION_TERMS}")
                 print(f"      \"{point[:80]}{'...' if len(point) > 80 else ''}\"")
         
         # Next steps based on quality
@@ -231,9 +296,10 @@ def test_real_paper_analysis(pdf_path: str):
         return quality_score >= 6  # Lowered threshold slightly for comprehensive test
         
     except Exception as e:
-        print(f"❌ Error during analysis: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Error during analysis: {type(e).__name__}: {e}")
+        if VERBOSE:
+            import traceback
+            traceback.print_exc()
         return False
 
 
@@ -3,6 +3,7 @@
 
 import sys
 import os
+import re
 from pathlib import Path
 
 # Add src directory to path
@@ -12,13 +13,59 @@ sys.path.append('.')
 # Import existing components and enhanced analyzer
 try:
     from pdf_processor import PDFProcessor
-    from enhanced_analyzer import EnhancedPaperAnalyzer
+    from enhanced_analyzer import EnhancedPaperAnalyzer, stage1_lines_before_closing
+    import pipeline_cache
+    import analyzers_registry
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("Make sure you're running from the project root directory")
     sys.exit(1)
 
 
+# TEST_VERBOSE=0 skips the text/section previews, result listings and failure
+# tracebacks (e.g. in CI, where output goes nowhere); scores, summaries and
+# one-line errors always print
+VERBOSE = os.environ.get('TEST_VERBOSE', '1') == '1'
+
+# Title-only fallback: the first few fixed-size chunks of the paper are kept
+# if they mention any of these words
+FALLBACK_CHUNK_SIZE = 2000
+FALLBACK_CHUNK_COUNT = 3
+FALLBACK_CHUNK_RE = re.compile(r'abstract|introduction|method|result', re.IGNORECASE)
+
+
+def test_stage1_stream_cutoff():
+    """The streamed Stage 1 response is only cut at closing remarks after the debate points"""
+    
+    response = [
+        "**5. DEBATE SEED POINTS:**",
+        "Overall, experts could debate the following points:",
+        "- Methodology Concerns: the baselines are weak and untuned",
+        "- Evidence Gaps: no ablation of the core components",
+        "Overall, this paper makes a useful but limited contribution.",
+    ]
+    kept = list(stage1_lines_before_closing(response))
+    
+    # The intro line under the header must not end the stream...
+    assert kept[:4] == response[:4], f"Debate points cut short: {kept}"
+    # ...but the closing remark after the points does
+    assert kept == response[:4], f"Closing remark kept: {kept}"
+    
+    # An "Overall ..." elaboration between bullets is not the end of the list
+    interleaved = [
+        "**5. DEBATE SEED POINTS:**",
+        "- Methodology Concerns: the baselines are weak and untuned",
+        "Overall, the method only beats baselines on the small datasets.",
+        "- Evidence Gaps: no ablation of the core components",
+        "- Generalizability: only two English-language benchmarks",
+        "",
+        "In summary, these points give the debate plenty of material.",
+    ]
+    kept = list(stage1_lines_before_closing(interleaved))
+    assert kept == interleaved[:6], f"Debate points after the elaboration dropped: {kept}"
+    print("✅ Stage 1 stream cutoff keeps the intro line, interleaved elaboration and every debate point")
+
+
 def test_real_paper_analysis(pdf_path: str):
     """Test Stage 1 analysis with a real PDF paper"""
     
@@ -34,10 +81,10 @@ def test_real_paper_analysis(pdf_path: str):
     
     # Initialize processors
     pdf_processor = PDFProcessor()
-    analyzer = EnhancedPaperAnalyzer()
+    analyzer = analyzers_registry.get(EnhancedPaperAnalyzer)
     
     # Test connections
-    if not analyzer.test_connection():
+    if not analyzers_registry.check_connection(analyzer):
         print("❌ Ollama connection failed")
         return False
     
@@ -50,7 +97,8 @@ def test_real_paper_analysis(pdf_path: str):
         raw_text = paper_data["raw_text"]
         
         print(f"✅ Extracted {len(raw_text):,} characters")
-        print(f"📊 Text preview: {raw_text[:5000]}...")
+        if VERBOSE:
+            print(f"📊 Text preview: {raw_text[:5000]}...")
         
         # Step 2: DIRECT section detection on raw text (bypass old processor)
         print("\n🔍 Step 2: Enhanced section detection on raw text...")
@@ -62,6 +110,8 @@ def test_real_paper_analysis(pdf_path: str):
         print(f"\n📋 Enhanced detection results:")
         for section, content in core_sections.items():
             print(f"   ✅ {section}: {len(content)} characters")
+            if not VERBOSE:
+                continue
             # Show more preview for debugging
             preview = content.replace('\n', ' ')[:150]
             print(f"      Preview: {preview}...")
@@ -78,10 +128,11 @@ def test_real_paper_analysis(pdf_path: str):
         
         elif len(core_sections) == 1 and 'title' in core_sections:
             print("⚠️ Only title found - adding text chunks for analysis")
-            # Add some text chunks for analysis
-            chunks = [raw_text[i:i+2000] for i in range(0, len(raw_text), 2000)]
-            for i, chunk in enumerate(chunks[:3]):  # First 3 chunks
-                if any(word in chunk.lower() for word in ['abstract', 'introduction', 'method', 'result']):
+            # Add some text chunks for analysis; only the chunks that are used
+            # get sliced, and none of them is lowercased
+            for i in range(FALLBACK_CHUNK_COUNT):
+                chunk = raw_text[i * FALLBACK_CHUNK_SIZE:(i + 1) * FALLBACK_CHUNK_SIZE]
+                if chunk and FALLBACK_CHUNK_RE.search(chunk):
                     core_sections[f'chunk_{i}'] = chunk
         
         # Step 3: Stage 1 analysis
@@ -98,32 +149,32 @@ def test_real_paper_analysis(pdf_path: str):
         print(f"   {core_understanding.field_classification}")
         
         print(f"\n📖 RESEARCH STORY ARC:")
-        if core_understanding.research_story_arc:
+        if not core_understanding.research_story_arc:
+            print("   ❌ No story elements parsed")
+        elif VERBOSE:
             for key, value in core_understanding.research_story_arc.items():
                 print(f"   • {key.replace('_', ' ').title()}: {value}")
-        else:
-            print("   ❌ No story elements parsed")
         
         print(f"\n🔍 CONFIDENCE ASSESSMENT:")
-        if core_understanding.confidence_assessment:
+        if not core_understanding.confidence_assessment:
+            print("   ❌ No confidence elements parsed")
+        elif VERBOSE:
             for key, value in core_understanding.confidence_assessment.items():
                 print(f"   • {key.replace('_', ' ').title()}: {value}")
-        else:
-            print("   ❌ No confidence elements parsed")
         
         print(f"\n⚔️ DEBATE SEED POINTS ({len(core_understanding.debate_seed_points)}):")
-        if core_understanding.debate_seed_points:
+        if not core_understanding.debate_seed_points:
+            print("   ❌ No debate points generated")
+        elif VERBOSE:
             for i, point in enumerate(core_understanding.debate_seed_points, 1):
                 print(f"   {i}. {point}")
-        else:
-            print("   ❌ No debate points generated")
         
         print(f"\n🔧 TECHNICAL ELEMENTS ({len(core_understanding.key_technical_elements)}):")
-        if core_understanding.key_technical_elements:
+        if not core_understanding.key_technical_elements:
+            print("   ❌ No technical elements extracted")
+        elif VERBOSE:
             for i, element in enumerate(core_understanding.key_technical_elements, 1):
                 print(f"   {i}. {element}")
-        else:
-            print("   ❌ No technical elements extracted")
         
         # Quality assessment
         print(f"\n📈 QUALITY ASSESSMENT:")
@@ -174,9 +225,10 @@ def test_real_paper_analysis(pdf_path: str):
         return quality_score >= 5
         
     except Exception as e:
-        print(f"❌ Error during analysis: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Error during analysis: {type(e).__name__}: {e}")
+        if VERBOSE:
+            import traceback
+            traceback.print_exc()
         return False
 
 
@@ -187,6 +239,13 @@ def main():
     print("Testing Enhanced Stage 1 Analysis")
     print("-" * 60)
     
+    # PDF extraction, section detection and Stage 1 are cached on disk (keyed
+    # by the paper's content), so reruns go straight to the later stages
+    if "--no-cache" in sys.argv:
+        sys.argv.remove("--no-cache")
+        pipeline_cache.disable()
+        print("💾 Pipeline cache disabled")
+    
     # Default paper path
     default_path = "/home/md724/ai_paper_narrator/data/input/WCC_and_CM_Paper_Complex_Networks-1.pdf"
     
@@ -197,6 +256,8 @@ def main():
     
     print(f"📄 Testing with: {pdf_path}")
     
+    test_stage1_stream_cutoff()
+    
     success = test_real_paper_analysis(pdf_path)
     
     if success: